@@ -6,6 +6,8 @@ from pathlib import Path
 
 import duckdb
 
+from rollups import build_rollups, record_parts
+
 ROOT = Path(__file__).resolve().parents[1]
 PARQUET_DIR = ROOT / "data" / "data_10m"
 
@@ -136,6 +138,13 @@ def main():
     n = cur.execute("SELECT COUNT(*) FROM data").fetchone()[0]
     print(f"[sqlite] load done: seconds={(t1 - t0):.3f} rows={n:,}")
 
+    t0 = time.perf_counter()
+    build_rollups(con)
+    record_parts(con, [p.name for p in parts])
+    con.commit()
+    t1 = time.perf_counter()
+    print(f"[sqlite] rollups done: seconds={(t1 - t0):.3f}")
+
     con.close()
     dcon.close()
 
@@ -5,6 +5,8 @@ from pathlib import Path
 
 import duckdb
 
+from rollups import build_rollups, record_parts
+
 ROOT = Path(__file__).resolve().parents[1]
 PARQUET_DIR = ROOT / "data" / "data_10m"
 
@@ -40,6 +42,12 @@ def main():
     n = con.execute("SELECT COUNT(*) FROM data").fetchone()[0]
     print(f"[duckdb] load done: seconds={(t1 - t0):.3f} rows={n:,}")
 
+    t0 = time.perf_counter()
+    build_rollups(con)
+    record_parts(con, [p.name for p in parts])
+    t1 = time.perf_counter()
+    print(f"[duckdb] rollups done: seconds={(t1 - t0):.3f}")
+
     con.close()
 
 
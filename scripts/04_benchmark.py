@@ -7,6 +7,8 @@ from statistics import median
 
 import duckdb
 
+from queries import QUERIES
+
 ROOT = Path(__file__).resolve().parents[1]
 SQLITE_PATH = ROOT / "db" / "sqlite.db"
 DUCKDB_PATH = ROOT / "db" / "duckdb.db"
@@ -19,131 +21,6 @@ WARMUP = 1
 REPEATS = 5
 DUCKDB_THREADS = 4
 
-QUERIES: list[tuple[str, str]] = [
-    ("Q1_conditional_agg_rates", """
-        WITH base AS (
-          SELECT
-            company_name,
-            function,
-            "year-month" AS ym,
-            state_of_residence AS state,
-            gender,
-            segmentation,
-            salary_usd,
-            performance_score,
-            flag_leave,
-            flag_turnover,
-            is_promoted
-          FROM data
-          WHERE year IN ('2022Y','2023Y','2024Y')
-        )
-        SELECT
-          company_name,
-          function,
-          ym,
-          state,
-          gender,
-          segmentation,
-          COUNT(*) AS n,
-          AVG(salary_usd) AS avg_salary,
-          AVG(performance_score) AS avg_perf,
-          SUM(CASE WHEN performance_score >= 4 THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS pct_perf4,
-          SUM(CASE WHEN is_promoted = 1 THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS promo_rate,
-          SUM(flag_leave) * 1.0 / COUNT(*) AS leave_rate,
-          SUM(flag_turnover) * 1.0 / COUNT(*) AS turnover_rate
-        FROM base
-        GROUP BY company_name, function, ym, state, gender, segmentation
-    """),
-
-    ("Q2_distinct_counts", """
-        SELECT
-          "year-month" AS ym,
-          company_name,
-          COUNT(*) AS rows,
-          COUNT(DISTINCT employee_id) AS distinct_employees,
-          COUNT(DISTINCT fullname) AS distinct_names
-        FROM data
-        WHERE state_of_residence IN ('California','New York','Florida')
-        GROUP BY ym, company_name
-    """),
-
-    ("Q3_topN_per_group", """
-        SELECT *
-        FROM (
-          SELECT
-            company_name,
-            "year-month" AS ym,
-            employee_id,
-            salary_usd,
-            performance_score,
-            ROW_NUMBER() OVER (
-              PARTITION BY company_name, "year-month"
-              ORDER BY salary_usd DESC
-            ) AS rn
-          FROM data
-          WHERE year='2024Y'
-        )
-        WHERE rn <= 10
-    """),
-
-    ("Q4_running_total", """
-        WITH m AS (
-          SELECT
-            company_name,
-            "year-month" AS ym,
-            SUM(salary_usd) AS monthly_salary
-          FROM data
-          GROUP BY company_name, "year-month"
-        )
-        SELECT
-          company_name,
-          ym,
-          monthly_salary,
-          SUM(monthly_salary) OVER (
-            PARTITION BY company_name
-            ORDER BY ym
-            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
-          ) AS cumulative_salary
-        FROM m
-    """),
-
-    ("Q5_join_vs_avg", """
-        WITH avg_by_grp AS (
-          SELECT
-            company_name,
-            "year-month" AS ym,
-            AVG(salary_usd) AS avg_salary
-          FROM data
-          GROUP BY company_name, "year-month"
-        )
-        SELECT
-          d.company_name,
-          d."year-month" AS ym,
-          COUNT(*) AS above_avg_count
-        FROM data d
-        JOIN avg_by_grp a
-          ON d.company_name = a.company_name
-         AND d."year-month" = a.ym
-        WHERE d.salary_usd > a.avg_salary
-        GROUP BY d.company_name, d."year-month"
-    """),
-
-    ("Q6_selective_like_filter", """
-        SELECT
-          company_name,
-          function,
-          "year-month" AS ym,
-          COUNT(*) AS n,
-          AVG(salary_usd) AS avg_salary
-        FROM data
-        WHERE year='2023Y'
-          AND state_of_residence='California'
-          AND function LIKE '%Sales%'
-          AND employee_type='White-Collar'
-        GROUP BY company_name, function, ym
-    """),
-]
-
 def log(line: str) -> None:
     print(line)
     with open(LOG_PATH, "a", encoding="utf-8") as f:
@@ -14,8 +14,15 @@ LOG_DIR = ROOT / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 LOG_PATH = LOG_DIR / "read_benchmark.log"
 
-BATCH_ROWS = 50_000
+BATCH_SIZES = [10_000, 50_000, 200_000]
 DUCKDB_THREADS = 4
+SAMPLE_ROWS = 100_000
+
+PROJECTIONS: list[tuple[str, str]] = [
+    ("cols_1", "salary_usd"),
+    ("cols_5", 'employee_id, company_name, "year-month", salary_usd, performance_score'),
+    ("cols_all", "*"),
+]
 
 def log(line: str) -> None:
     print(line)
@@ -33,14 +40,22 @@ def ensure_sqlite_pragmas(conn: sqlite3.Connection) -> None:
     cur.execute("PRAGMA cache_size=-200000;")
     conn.commit()
 
-def sqlite_select_star_stream(conn: sqlite3.Connection) -> tuple[int, float]:
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM data;")
+def projection_sql(cols: str) -> str:
+    return f"SELECT {cols} FROM data;"
 
+def bytes_per_row(conn: duckdb.DuckDBPyConnection, cols: str) -> float:
+    """Arrow size of a row of this projection; used as the byte count for every read path."""
+    tbl = conn.execute(f"SELECT {cols} FROM data LIMIT {SAMPLE_ROWS};").arrow()
+    return tbl.nbytes / max(tbl.num_rows, 1)
+
+def sqlite_tuple_stream(conn: sqlite3.Connection, sql: str, batch_rows: int) -> tuple[int, float]:
     total = 0
     t0 = now_s()
+    cur = conn.cursor()
+    cur.execute(sql)
+
     while True:
-        batch = cur.fetchmany(BATCH_ROWS)
+        batch = cur.fetchmany(batch_rows)
         if not batch:
             break
         total += len(batch)
@@ -48,13 +63,21 @@ def sqlite_select_star_stream(conn: sqlite3.Connection) -> tuple[int, float]:
 
     return total, (t1 - t0)
 
-def duckdb_select_star_stream(conn: duckdb.DuckDBPyConnection) -> tuple[int, float]:
-    cur = conn.execute("SELECT * FROM data;")
+def sqlite_bytes_stream(conn: sqlite3.Connection, sql: str, batch_rows: int) -> tuple[int, float]:
+    # plain tuples with TEXT left as raw bytes: skips the per-value str decode
+    conn.text_factory = bytes
+    try:
+        return sqlite_tuple_stream(conn, sql, batch_rows)
+    finally:
+        conn.text_factory = str
 
+def duckdb_tuple_stream(conn: duckdb.DuckDBPyConnection, sql: str, batch_rows: int) -> tuple[int, float]:
     total = 0
     t0 = now_s()
+    cur = conn.execute(sql)
+
     while True:
-        batch = cur.fetchmany(BATCH_ROWS)
+        batch = cur.fetchmany(batch_rows)
         if not batch:
             break
         total += len(batch)
@@ -62,6 +85,39 @@ def duckdb_select_star_stream(conn: duckdb.DuckDBPyConnection) -> tuple[int, flo
 
     return total, (t1 - t0)
 
+def duckdb_arrow_stream(conn: duckdb.DuckDBPyConnection, sql: str, batch_rows: int) -> tuple[int, float]:
+    total = 0
+    t0 = now_s()
+    reader = conn.execute(sql).fetch_record_batch(batch_rows)
+
+    for batch in reader:
+        total += batch.num_rows
+    t1 = now_s()
+
+    return total, (t1 - t0)
+
+def duckdb_numpy_stream(conn: duckdb.DuckDBPyConnection, sql: str, batch_rows: int) -> tuple[int, float]:
+    # fetchnumpy() materialises the whole result (VARCHAR as object arrays of str),
+    # so convert one record batch at a time instead
+    total = 0
+    t0 = now_s()
+    reader = conn.execute(sql).fetch_record_batch(batch_rows)
+
+    for batch in reader:
+        _ = [col.to_numpy(zero_copy_only=False) for col in batch.columns]
+        total += batch.num_rows
+    t1 = now_s()
+
+    return total, (t1 - t0)
+
+def log_read(engine: str, path: str, proj: str, batch: str, rows: int, seconds: float, row_bytes: float) -> None:
+    rows_s = rows / seconds if seconds > 0 else 0.0
+    mb_s = rows_s * row_bytes / 1e6
+    log(
+        f"{engine} | read_{path} | {proj} | batch={batch} | seconds={seconds:.4f} | rows={rows} "
+        f"| rows_per_s={rows_s:,.0f} | mb_per_s={mb_s:.1f}"
+    )
+
 def main() -> None:
     if LOG_PATH.exists():
         LOG_PATH.unlink()
@@ -69,7 +125,13 @@ def main() -> None:
     log("meta | read_benchmark_start")
     log(f"meta | sqlite_db={SQLITE_PATH}")
     log(f"meta | duckdb_db={DUCKDB_PATH}")
-    log(f"meta | batch_rows={BATCH_ROWS}")
+    log(f"meta | batch_sizes={','.join(str(b) for b in BATCH_SIZES)}")
+    log(f"meta | projections={','.join(p for p, _ in PROJECTIONS)}")
+    log("meta | seconds include query execution; bytes are arrow-equivalent per projection")
+
+    duck_conn = duckdb.connect(DUCKDB_PATH.as_posix())
+    duck_conn.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+    row_bytes = {proj: bytes_per_row(duck_conn, cols) for proj, cols in PROJECTIONS}
 
     sqlite_conn = sqlite3.connect(SQLITE_PATH.as_posix())
     ensure_sqlite_pragmas(sqlite_conn)
@@ -77,21 +139,32 @@ def main() -> None:
     s_rows = sqlite_conn.execute("SELECT COUNT(*) FROM data").fetchone()[0]
     log(f"verify | rowcount | sqlite={s_rows}")
 
-    log("read | start | engine=sqlite | query=select_star")
-    rows, seconds = sqlite_select_star_stream(sqlite_conn)
-    log(f"sqlite | read_select_star | seconds={seconds:.4f} | rows={rows}")
+    sqlite_paths = [("tuples", sqlite_tuple_stream), ("bytes_text", sqlite_bytes_stream)]
+    for proj, cols in PROJECTIONS:
+        sql = projection_sql(cols)
+        for path, fn in sqlite_paths:
+            log(f"read | start | engine=sqlite | path={path} | {proj}")
+            for batch_rows in BATCH_SIZES:
+                rows, seconds = fn(sqlite_conn, sql, batch_rows)
+                log_read("sqlite", path, proj, str(batch_rows), rows, seconds, row_bytes[proj])
 
     sqlite_conn.close()
 
-    duck_conn = duckdb.connect(DUCKDB_PATH.as_posix())
-    duck_conn.execute(f"PRAGMA threads={DUCKDB_THREADS};")
-
     d_rows = duck_conn.execute("SELECT COUNT(*) FROM data").fetchone()[0]
     log(f"verify | rowcount | duckdb={d_rows}")
 
-    log("read | start | engine=duckdb | query=select_star")
-    rows, seconds = duckdb_select_star_stream(duck_conn)
-    log(f"duckdb | read_select_star | seconds={seconds:.4f} | rows={rows}")
+    duck_paths = [
+        ("tuples", duckdb_tuple_stream),
+        ("arrow_batches", duckdb_arrow_stream),
+        ("numpy_batches", duckdb_numpy_stream),
+    ]
+    for proj, cols in PROJECTIONS:
+        sql = projection_sql(cols)
+        for path, fn in duck_paths:
+            log(f"read | start | engine=duckdb | path={path} | {proj}")
+            for batch_rows in BATCH_SIZES:
+                rows, seconds = fn(duck_conn, sql, batch_rows)
+                log_read("duckdb", path, proj, str(batch_rows), rows, seconds, row_bytes[proj])
 
     duck_conn.close()
 
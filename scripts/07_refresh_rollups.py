@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import duckdb
+
+from rollups import PARTS_TABLE, existing_tables, loaded_parts, record_parts, refresh_rollups
+
+ROOT = Path(__file__).resolve().parents[1]
+PARQUET_DIR = ROOT / "data" / "data_10m"
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+
+CHUNK = 200_000
+DUCKDB_THREADS = 4
+
+ENGINES = ["sqlite", "duckdb"]
+
+
+def quote_col(c: str) -> str:
+    return f'"{c}"' if ("-" in c or " " in c) else c
+
+
+def parquet_list(paths: list[Path]) -> str:
+    return "[" + ",".join(f"'{p.as_posix()}'" for p in paths) + "]"
+
+
+def new_parts(con, engine: str, parts: list[Path]) -> list[Path]:
+    if PARTS_TABLE not in existing_tables(con, engine):
+        raise RuntimeError(f"{engine} db has no {PARTS_TABLE} table; rebuild it with the loader first")
+    done = loaded_parts(con)
+    return [p for p in parts if p.name not in done]
+
+
+def refresh_sqlite(parts: list[Path]) -> None:
+    con = sqlite3.connect(SQLITE_PATH.as_posix())
+    cur = con.cursor()
+
+    todo = new_parts(con, "sqlite", parts)
+    if not todo:
+        print("[sqlite] [skip] no new parts")
+        con.close()
+        return
+
+    print(f"[sqlite] refresh start: new_parts={len(todo)}")
+    t0 = time.perf_counter()
+
+    max_rowid = cur.execute("SELECT COALESCE(MAX(rowid), 0) FROM data").fetchone()[0]
+
+    dcon = duckdb.connect(database=":memory:")
+    dcon.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+    res = dcon.execute(f"SELECT * FROM read_parquet({parquet_list(todo)})")
+    cols = [d[0] for d in res.description]
+
+    col_list = ",".join(quote_col(c) for c in cols)
+    placeholders = ",".join(["?"] * len(cols))
+    insert_sql = f"INSERT INTO data ({col_list}) VALUES ({placeholders})"
+
+    inserted = 0
+    cur.execute("BEGIN;")
+
+    while True:
+        batch = res.fetchmany(CHUNK)
+        if not batch:
+            break
+
+        cur.executemany(insert_sql, batch)
+        inserted += len(batch)
+
+    refresh_rollups(con, f"(SELECT * FROM data WHERE rowid > {max_rowid})")
+    record_parts(con, [p.name for p in todo])
+    con.commit()
+    t1 = time.perf_counter()
+
+    print(f"[sqlite] refresh done: seconds={(t1 - t0):.3f} rows_appended={inserted:,}")
+
+    con.close()
+    dcon.close()
+
+
+def refresh_duckdb(parts: list[Path]) -> None:
+    con = duckdb.connect(DUCKDB_PATH.as_posix())
+    con.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    todo = new_parts(con, "duckdb", parts)
+    if not todo:
+        print("[duckdb] [skip] no new parts")
+        con.close()
+        return
+
+    print(f"[duckdb] refresh start: new_parts={len(todo)}")
+    t0 = time.perf_counter()
+
+    source = f"read_parquet({parquet_list(todo)})"
+
+    con.execute("BEGIN TRANSACTION;")
+    inserted = con.execute(f"INSERT INTO data SELECT * FROM {source};").fetchone()[0]
+    refresh_rollups(con, source)
+    record_parts(con, [p.name for p in todo])
+    con.execute("COMMIT;")
+    t1 = time.perf_counter()
+
+    print(f"[duckdb] refresh done: seconds={(t1 - t0):.3f} rows_appended={inserted:,}")
+
+    con.close()
+
+
+def main():
+    # optional engine names restrict the refresh, e.g. `07_refresh_rollups.py sqlite`
+    engines = sys.argv[1:] or ENGINES
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown:
+        raise ValueError(f"unknown engine(s): {', '.join(unknown)} (expected: {', '.join(ENGINES)})")
+
+    if "sqlite" in engines and not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+    if "duckdb" in engines and not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    parts = sorted(PARQUET_DIR.glob("part_*.parquet"))
+    if not parts:
+        raise FileNotFoundError(f"No parquet parts found in: {PARQUET_DIR}")
+
+    if "sqlite" in engines:
+        refresh_sqlite(parts)
+    if "duckdb" in engines:
+        refresh_duckdb(parts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import math
+import time
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+from statistics import median
+
+import duckdb
+
+from queries import QUERIES
+from rollups import ROUTES, existing_tables, route
+
+ROOT = Path(__file__).resolve().parents[1]
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_rollups.log"
+
+WARMUP = 1
+REPEATS = 5
+DUCKDB_THREADS = 4
+REL_TOL = 1e-6
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+def strip_trailing_semicolon(sql: str) -> str:
+    s = sql.strip()
+    if s.endswith(";"):
+        s = s[:-1].rstrip()
+    return s
+
+def wrap_count(sql: str) -> str:
+    inner = strip_trailing_semicolon(sql)
+    return f"SELECT COUNT(*) FROM ({inner}) t;"
+
+def run_count(conn, sql: str) -> int:
+    out = conn.execute(wrap_count(sql)).fetchone()
+    return int(out[0]) if out else 0
+
+def time_query(conn, sql: str) -> tuple[float, int]:
+    for _ in range(WARMUP):
+        _ = run_count(conn, sql)
+
+    times: list[float] = []
+    last_rows: int = 0
+
+    for _ in range(REPEATS):
+        t0 = now_s()
+        last_rows = run_count(conn, sql)
+        t1 = now_s()
+        times.append(t1 - t0)
+
+    return median(times), last_rows
+
+def normalize(row: tuple) -> tuple:
+    return tuple(float(v) if isinstance(v, (float, Decimal)) else v for v in row)
+
+def sort_key(row: tuple) -> tuple:
+    return tuple(round(v, 6) if isinstance(v, float) else v for v in row)
+
+def same_rows(got: list[tuple], expected: list[tuple]) -> bool:
+    if len(got) != len(expected):
+        return False
+    got = sorted((normalize(r) for r in got), key=sort_key)
+    expected = sorted((normalize(r) for r in expected), key=sort_key)
+    for a, b in zip(got, expected):
+        for x, y in zip(a, b):
+            if isinstance(x, float) or isinstance(y, float):
+                if not math.isclose(x, y, rel_tol=REL_TOL):
+                    return False
+            elif x != y:
+                return False
+    return True
+
+def benchmark_engine(name: str, conn) -> None:
+    available = existing_tables(conn, name)
+
+    for qname, sql in QUERIES:
+        if qname not in ROUTES:
+            continue
+
+        routed_sql, source = route(qname, sql, available)
+        if source == "data":
+            log(f"{name} | {qname} | [skip] rollup={ROUTES[qname][0]} missing, falls back to data")
+            continue
+
+        base_s, base_rows = time_query(conn, sql)
+        log(f"{name} | {qname} | data | {base_s:.4f}s | rows={base_rows}")
+
+        rollup_s, rollup_rows = time_query(conn, routed_sql)
+        log(f"{name} | {qname} | {source} | {rollup_s:.4f}s | rows={rollup_rows}")
+
+        # a wrong merge in refresh_rollups keeps the row count, so compare values (untimed)
+        expected = conn.execute(sql).fetchall()
+        got = conn.execute(routed_sql).fetchall()
+        match = "ok" if same_rows(got, expected) else "MISMATCH"
+
+        speedup = base_s / rollup_s if rollup_s > 0 else float("inf")
+        log(f"{name} | {qname} | speedup={speedup:.1f}x | values={match}")
+
+
+def ensure_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute("PRAGMA synchronous=NORMAL;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA cache_size=-200000;")
+    conn.commit()
+
+
+def main() -> None:
+    if not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | rollup_benchmark_start")
+    log(f"meta | warmup={WARMUP} repeats={REPEATS}")
+    log(f"meta | routed_queries={','.join(ROUTES)}")
+
+    sqlite_conn = sqlite3.connect(SQLITE_PATH.as_posix())
+    ensure_sqlite_pragmas(sqlite_conn)
+
+    duck_conn = duckdb.connect(DUCKDB_PATH.as_posix())
+    duck_conn.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    log("bench | start | engine=sqlite")
+    benchmark_engine("sqlite", sqlite_conn)
+
+    log("bench | start | engine=duckdb")
+    benchmark_engine("duckdb", duck_conn)
+
+    sqlite_conn.close()
+    duck_conn.close()
+
+    log("meta | rollup_benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import csv
+import importlib
+import math
+import random
+import sqlite3
+import time
+from pathlib import Path
+from statistics import NormalDist, median
+
+import duckdb
+import matplotlib
+import polars as pl
+
+from queries import Q6_PREDICATE, TEMPLATES, render
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+gen = importlib.import_module("01_generate_data")
+
+ROOT = Path(__file__).resolve().parents[1]
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+PARQUET_GLOB = (ROOT / "data" / "data_10m" / "*.parquet").as_posix()
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "workload_sweep.log"
+SWEEP_CSV = LOG_DIR / "selectivity_sweep.csv"
+SWEEP_PNG = LOG_DIR / "selectivity_sweep.png"
+
+SEED = 7
+WARMUP = 1
+REPEATS = 3
+RANDOM_INSTANCES = 20
+DUCKDB_THREADS = 4
+
+SWEEP_TEMPLATE = "Q6_selective_filter"
+SELECTIVITIES = [0.0001, 0.001, 0.01, 0.05, 0.1, 0.25, 0.5]
+
+# salary_usd ~ lognormal(10.5, 0.3) in make_chunk
+SALARY_MU = 10.5
+SALARY_SIGMA = 0.3
+
+# sweep parameter -> generator domain, each drawn uniformly per row
+SWEEP_DIMENSIONS = {
+    "years": "YEAR",
+    "states": "STATES",
+    "functions": "FUNCTION",
+    "employee_types": "EMPLOYEE_TYPE",
+}
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+def domain_values(name: str) -> list[str]:
+    return [str(v) for v in getattr(gen, name)]
+
+def random_params(spec: dict[str, tuple[str, object]], rng: random.Random) -> dict[str, object]:
+    params: dict[str, object] = {}
+    for name, (kind, domain) in spec.items():
+        if kind == "text":
+            params[name] = rng.choice(domain_values(domain))
+        elif kind == "text_list":
+            values = domain_values(domain)
+            params[name] = rng.sample(values, rng.randint(1, len(values)))
+        elif kind == "int":
+            params[name] = rng.randint(*domain)
+        else:
+            params[name] = rng.uniform(*domain)
+    return params
+
+def salary_at_upper_fraction(frac: float) -> float:
+    """Salary threshold above which `frac` of rows fall."""
+    if frac >= 1.0:
+        return 0.0
+    return math.exp(SALARY_MU + SALARY_SIGMA * NormalDist().inv_cdf(1.0 - frac))
+
+def sweep_params(target: float, rng: random.Random) -> dict[str, object]:
+    """Narrow the categorical filters as far as `target` allows, then finish with a salary cut."""
+    params: dict[str, object] = {}
+    frac = 1.0
+
+    names = list(SWEEP_DIMENSIONS)
+    rng.shuffle(names)
+    for name in names:
+        values = domain_values(SWEEP_DIMENSIONS[name])
+        k = len(values)
+        while k > 1 and frac * (k - 1) / len(values) >= target:
+            k -= 1
+        params[name] = rng.sample(values, k)
+        frac *= k / len(values)
+
+    params["salary_min"] = salary_at_upper_fraction(target / frac)
+    return params
+
+def strip_trailing_semicolon(sql: str) -> str:
+    s = sql.strip()
+    if s.endswith(";"):
+        s = s[:-1].rstrip()
+    return s
+
+def wrap_count(sql: str) -> str:
+    inner = strip_trailing_semicolon(sql)
+    return f"SELECT COUNT(*) FROM ({inner}) t;"
+
+def run_sql_count(conn, sql: str) -> int:
+    out = conn.execute(wrap_count(sql)).fetchone()
+    return int(out[0]) if out else 0
+
+def q6_polars(lf: pl.LazyFrame, params: dict[str, object]) -> pl.LazyFrame:
+    return (
+        lf.filter(
+            pl.col("year").is_in(params["years"])
+            & pl.col("state_of_residence").is_in(params["states"])
+            & pl.col("function").is_in(params["functions"])
+            & pl.col("employee_type").is_in(params["employee_types"])
+            & (pl.col("salary_usd") >= params["salary_min"])
+        )
+        .group_by([pl.col("company_name"), pl.col("function"), pl.col("year-month").alias("ym")])
+        .agg([
+            pl.len().alias("n"),
+            pl.col("salary_usd").mean().alias("avg_salary"),
+        ])
+    )
+
+def run_polars_count(lf: pl.LazyFrame, params: dict[str, object]) -> int:
+    return int(q6_polars(lf, params).select(pl.len()).collect().item())
+
+def time_runner(runner) -> tuple[float, int]:
+    for _ in range(WARMUP):
+        _ = runner()
+
+    times: list[float] = []
+    last_rows: int = 0
+
+    for _ in range(REPEATS):
+        t0 = now_s()
+        last_rows = runner()
+        t1 = now_s()
+        times.append(t1 - t0)
+
+    return median(times), last_rows
+
+def random_workload(engines: dict[str, object], rng: random.Random) -> None:
+    for qname, sql, spec in TEMPLATES:
+        instances = [render(sql, spec, random_params(spec, rng)) for _ in range(RANDOM_INSTANCES)]
+
+        for name, conn in engines.items():
+            times: list[float] = []
+            for inst in instances:
+                t0 = now_s()
+                _ = run_sql_count(conn, inst)
+                t1 = now_s()
+                times.append(t1 - t0)
+
+            times.sort()
+            p95 = times[min(len(times) - 1, int(0.95 * len(times)))]
+            log(f"{name} | {qname} | random_params | n={len(times)} | p50={median(times):.4f}s | p95={p95:.4f}s")
+
+def selectivity_sweep(engines: dict[str, object], rng: random.Random) -> list[dict[str, object]]:
+    _, sql, spec = next(t for t in TEMPLATES if t[0] == SWEEP_TEMPLATE)
+    duck_conn = engines["duckdb"]
+    total = duck_conn.execute("SELECT COUNT(*) FROM data").fetchone()[0]
+    lf = pl.scan_parquet(PARQUET_GLOB)
+
+    rows: list[dict[str, object]] = []
+    for target in SELECTIVITIES:
+        params = sweep_params(target, rng)
+        predicate = render(Q6_PREDICATE, spec, params)
+        matched = duck_conn.execute(f"SELECT COUNT(*) FROM data WHERE {predicate}").fetchone()[0]
+        measured = matched / total
+        query = render(sql, spec, params)
+
+        runners = {name: (lambda c=conn: run_sql_count(c, query)) for name, conn in engines.items()}
+        runners["polars"] = lambda: run_polars_count(lf, params)
+
+        for name, runner in runners.items():
+            seconds, out_rows = time_runner(runner)
+            log(f"{name} | {SWEEP_TEMPLATE} | target={target:.4%} | measured={measured:.4%} | {seconds:.4f}s | rows={out_rows}")
+            rows.append({
+                "engine": name,
+                "target_selectivity": target,
+                "measured_selectivity": measured,
+                "matched_rows": matched,
+                "seconds": seconds,
+            })
+
+    return rows
+
+def write_sweep(rows: list[dict[str, object]]) -> None:
+    with open(SWEEP_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for engine in dict.fromkeys(r["engine"] for r in rows):
+        pts = sorted((r["measured_selectivity"], r["seconds"]) for r in rows if r["engine"] == engine)
+        ax.plot([p[0] for p in pts], [p[1] for p in pts], marker="o", label=engine)
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("selectivity (fraction of rows matched)")
+    ax.set_ylabel("median latency (s)")
+    ax.set_title(f"{SWEEP_TEMPLATE}: latency vs. selectivity")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(SWEEP_PNG)
+    plt.close(fig)
+
+
+def ensure_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute("PRAGMA synchronous=NORMAL;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA cache_size=-200000;")
+    conn.commit()
+
+
+def main() -> None:
+    if not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | workload_sweep_start")
+    log(f"meta | seed={SEED} warmup={WARMUP} repeats={REPEATS} random_instances={RANDOM_INSTANCES}")
+    log(f"meta | selectivities={','.join(str(s) for s in SELECTIVITIES)}")
+
+    sqlite_conn = sqlite3.connect(SQLITE_PATH.as_posix())
+    ensure_sqlite_pragmas(sqlite_conn)
+
+    duck_conn = duckdb.connect(DUCKDB_PATH.as_posix())
+    duck_conn.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    engines = {"sqlite": sqlite_conn, "duckdb": duck_conn}
+    rng = random.Random(SEED)
+
+    log("bench | start | random_workload")
+    random_workload(engines, rng)
+
+    log(f"bench | start | selectivity_sweep | template={SWEEP_TEMPLATE}")
+    rows = selectivity_sweep(engines, rng)
+    write_sweep(rows)
+    log(f"meta | sweep_csv={SWEEP_CSV}")
+    log(f"meta | sweep_plot={SWEEP_PNG}")
+
+    sqlite_conn.close()
+    duck_conn.close()
+
+    log("meta | workload_sweep_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import resource
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+
+import duckdb
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+ROOT = Path(__file__).resolve().parents[1]
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+PARQUET_GLOB = (ROOT / "data" / "data_10m" / "*.parquet").as_posix()
+EXPORT_DIR = ROOT / "exports"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_export.log"
+
+BATCH_ROWS = 100_000
+DUCKDB_THREADS = 4
+PARTITION_COL = "year"
+
+# (name, SQL for the database engines, same selection for Polars)
+SOURCES = [
+    ("data", "SELECT * FROM data", lambda lf: lf),
+    ("extract_2023Y", "SELECT * FROM data WHERE year='2023Y'", lambda lf: lf.filter(pl.col("year") == "2023Y")),
+]
+
+# (name, file kind, codec, hive-partitioned by PARTITION_COL)
+FORMATS: list[tuple[str, str, str | None, bool]] = [
+    ("parquet_snappy", "parquet", "snappy", False),
+    ("parquet_zstd", "parquet", "zstd", False),
+    ("parquet_uncompressed", "parquet", "uncompressed", False),
+    ("csv", "csv", None, False),
+    ("parquet_hive_year", "parquet", "snappy", True),
+]
+
+ENGINES = ["duckdb_copy", "polars_sink", "polars_write", "sqlite_arrow"]
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def output_bytes(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size
+
+def remove_output(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+def output_path(engine: str, source: str, fmt: str) -> Path:
+    _, kind, _, partitioned = next(f for f in FORMATS if f[0] == fmt)
+    name = f"{engine}__{source}__{fmt}"
+    return EXPORT_DIR / (name if partitioned else f"{name}.{kind}")
+
+def supported(engine: str, fmt: str) -> bool:
+    _, _, _, partitioned = next(f for f in FORMATS if f[0] == fmt)
+    # sink_parquet cannot write hive partitions
+    return not (engine == "polars_sink" and partitioned)
+
+
+def export_duckdb(sql: str, out: Path, kind: str, codec: str | None, partitioned: bool) -> None:
+    con = duckdb.connect(DUCKDB_PATH.as_posix(), read_only=True)
+    con.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    if kind == "csv":
+        options = "FORMAT CSV, HEADER"
+    else:
+        options = f"FORMAT PARQUET, COMPRESSION {codec}"
+    if partitioned:
+        options += f", PARTITION_BY ({PARTITION_COL}), OVERWRITE_OR_IGNORE"
+
+    con.execute(f"COPY ({sql}) TO '{out.as_posix()}' ({options});")
+    con.close()
+
+
+def export_polars_sink(select, out: Path, kind: str, codec: str | None) -> None:
+    lf = select(pl.scan_parquet(PARQUET_GLOB))
+    if kind == "csv":
+        lf.sink_csv(out)
+    else:
+        lf.sink_parquet(out, compression=codec)
+
+
+def export_polars_write(select, out: Path, kind: str, codec: str | None, partitioned: bool) -> None:
+    df = select(pl.scan_parquet(PARQUET_GLOB)).collect()
+    if kind == "csv":
+        df.write_csv(out)
+    elif partitioned:
+        df.write_parquet(out, compression=codec, use_pyarrow=True, pyarrow_options={"partition_cols": [PARTITION_COL]})
+    else:
+        df.write_parquet(out, compression=codec)
+
+
+def sqlite_batches(conn: sqlite3.Connection, sql: str):
+    cur = conn.execute(sql)
+    names = [d[0] for d in cur.description]
+    schema = None
+
+    while True:
+        rows = cur.fetchmany(BATCH_ROWS)
+        if not rows:
+            break
+
+        cols = list(zip(*rows))
+        if schema is None:
+            batch = pa.RecordBatch.from_arrays([pa.array(c) for c in cols], names=names)
+            schema = batch.schema
+        else:
+            batch = pa.RecordBatch.from_arrays([pa.array(c, type=f.type) for c, f in zip(cols, schema)], schema=schema)
+        yield batch
+
+
+def export_sqlite_arrow(sql: str, out: Path, kind: str, codec: str | None, partitioned: bool) -> None:
+    # ds.write_dataset pulls the batches on a pyarrow worker thread
+    conn = sqlite3.connect(SQLITE_PATH.as_posix(), check_same_thread=False)
+    batches = sqlite_batches(conn, sql)
+    first = next(batches)
+    schema = first.schema
+    compression = "none" if codec == "uncompressed" else codec
+
+    if kind == "csv":
+        with pa_csv.CSVWriter(out, schema) as writer:
+            for batch in chain([first], batches):
+                writer.write_batch(batch)
+    elif partitioned:
+        ds.write_dataset(
+            pa.RecordBatchReader.from_batches(schema, chain([first], batches)),
+            out,
+            format="parquet",
+            partitioning=[PARTITION_COL],
+            partitioning_flavor="hive",
+            file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+            existing_data_behavior="overwrite_or_ignore",
+        )
+    else:
+        with pq.ParquetWriter(out, schema, compression=compression) as writer:
+            for batch in chain([first], batches):
+                writer.write_batch(batch)
+
+    conn.close()
+
+
+def run_case(engine: str, source: str, fmt: str) -> tuple[float, int, float, float]:
+    """Runs in a fresh process so peak RSS belongs to this export alone."""
+    _, sql, select = next(s for s in SOURCES if s[0] == source)
+    _, kind, codec, partitioned = next(f for f in FORMATS if f[0] == fmt)
+    out = output_path(engine, source, fmt)
+
+    base_mb = peak_rss_mb()
+    try:
+        t0 = now_s()
+        if engine == "duckdb_copy":
+            export_duckdb(sql, out, kind, codec, partitioned)
+        elif engine == "polars_sink":
+            export_polars_sink(select, out, kind, codec)
+        elif engine == "polars_write":
+            export_polars_write(select, out, kind, codec, partitioned)
+        else:
+            export_sqlite_arrow(sql, out, kind, codec, partitioned)
+        t1 = now_s()
+        size = output_bytes(out)
+    finally:
+        # a full export is as large as the table; keep only one on disk at a time
+        remove_output(out)
+
+    return (t1 - t0), size, peak_rss_mb(), base_mb
+
+
+def main() -> None:
+    if not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+    if EXPORT_DIR.exists():
+        shutil.rmtree(EXPORT_DIR)
+    EXPORT_DIR.mkdir()
+
+    log("meta | export_benchmark_start")
+    log(f"meta | export_dir={EXPORT_DIR}")
+    log(f"meta | engines={','.join(ENGINES)}")
+    log(f"meta | formats={','.join(f[0] for f in FORMATS)}")
+
+    con = duckdb.connect(DUCKDB_PATH.as_posix(), read_only=True)
+    source_rows = {name: con.execute(f"SELECT COUNT(*) FROM ({sql}) t").fetchone()[0] for name, sql, _ in SOURCES}
+    con.close()
+
+    ctx = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx, max_tasks_per_child=1) as pool:
+        for source, _, _ in SOURCES:
+            rows = source_rows[source]
+            log(f"export | start | source={source} | rows={rows}")
+
+            for engine in ENGINES:
+                for fmt, _, _, _ in FORMATS:
+                    if not supported(engine, fmt):
+                        continue
+
+                    try:
+                        seconds, size, peak_mb, base_mb = pool.submit(run_case, engine, source, fmt).result()
+                    except Exception as e:  # one failing case should not abort the matrix
+                        remove_output(output_path(engine, source, fmt))
+                        log(f"{engine} | {source} | {fmt} | FAILED | {type(e).__name__}: {e}")
+                        continue
+                    rows_s = rows / seconds if seconds > 0 else 0.0
+                    log(
+                        f"{engine} | {source} | {fmt} | seconds={seconds:.4f} | rows_per_s={rows_s:,.0f} "
+                        f"| out_mb={size / 1e6:.1f} | out_mb_per_s={size / 1e6 / seconds:.1f} "
+                        f"| peak_rss_mb={peak_mb:.0f} | export_rss_mb={peak_mb - base_mb:.0f}"
+                    )
+
+    shutil.rmtree(EXPORT_DIR)
+
+    log("meta | export_benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import time
+from itertools import count
+from pathlib import Path
+from statistics import median
+
+import duckdb
+
+ROOT = Path(__file__).resolve().parents[1]
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_oltp.log"
+
+SEED = 11
+DUCKDB_THREADS = 4
+
+OPS_PER_PHASE = 1_000
+PHASE_BUDGET_S = 30.0
+WRITE_BATCH_ROWS = 100
+RANGE_WIDTH = 50
+
+# employee ids in the dataset are E000001..E499999 (see make_chunk)
+EMP_MIN = 1
+EMP_MAX = 499_999
+
+# rows written by this benchmark use their own id prefix and are deleted at the end
+WRITE_ID_PREFIX = "X"
+INDEX_NAME = "idx_data_employee_id"
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+def quote_col(c: str) -> str:
+    return f'"{c}"' if ("-" in c or " " in c) else c
+
+def emp_id(n: int) -> str:
+    return f"E{n:06d}"
+
+def percentile(sorted_vals: list[float], p: float) -> float:
+    return sorted_vals[min(len(sorted_vals) - 1, int(p * len(sorted_vals)))]
+
+
+class Workload:
+    """Keyed reads and small write transactions against one `data` table."""
+
+    def __init__(self, conn, rng: random.Random):
+        self.conn = conn
+        self.rng = rng
+        self.ids = count()
+        self.written: list[list[str]] = []
+        self.in_txn = False
+
+        cur = conn.execute("SELECT * FROM data LIMIT 1")
+        cols = [d[0] for d in cur.description]
+        self.template = list(cur.fetchone())
+        self.id_pos = cols.index("employee_id")
+        self.insert_sql = (
+            f"INSERT INTO data ({','.join(quote_col(c) for c in cols)}) "
+            f"VALUES ({','.join(['?'] * len(cols))})"
+        )
+
+    def begin(self) -> None:
+        self.conn.execute("BEGIN;")
+        self.in_txn = True
+
+    def commit(self) -> None:
+        self.conn.execute("COMMIT;")
+        self.in_txn = False
+
+    def point_lookup(self) -> int:
+        key = emp_id(self.rng.randint(EMP_MIN, EMP_MAX))
+        return len(self.conn.execute("SELECT * FROM data WHERE employee_id = ?", [key]).fetchall())
+
+    def employee_history(self) -> int:
+        key = emp_id(self.rng.randint(EMP_MIN, EMP_MAX))
+        return len(self.conn.execute(
+            'SELECT "year-month", salary_usd, performance_score FROM data WHERE employee_id = ? ORDER BY "year-month"',
+            [key],
+        ).fetchall())
+
+    def range_scan(self) -> int:
+        lo = self.rng.randint(EMP_MIN, EMP_MAX - RANGE_WIDTH)
+        return len(self.conn.execute(
+            "SELECT employee_id, salary_usd FROM data WHERE employee_id BETWEEN ? AND ?",
+            [emp_id(lo), emp_id(lo + RANGE_WIDTH)],
+        ).fetchall())
+
+    def insert_batch(self) -> int:
+        keys = [f"{WRITE_ID_PREFIX}{next(self.ids):07d}" for _ in range(WRITE_BATCH_ROWS)]
+        rows = []
+        for key in keys:
+            row = list(self.template)
+            row[self.id_pos] = key
+            rows.append(row)
+
+        self.begin()
+        self.conn.executemany(self.insert_sql, rows)
+        self.commit()
+        self.written.append(keys)
+        return len(rows)
+
+    def update_batch(self) -> int:
+        if not self.written:
+            self.insert_batch()
+        keys = self.rng.choice(self.written)
+
+        self.begin()
+        self.conn.execute(
+            f"UPDATE data SET salary_usd = salary_usd + 1 WHERE employee_id IN ({','.join(['?'] * len(keys))})",
+            keys,
+        )
+        self.commit()
+        return len(keys)
+
+    def cleanup(self) -> None:
+        # a failed write leaves its transaction open; roll it back before deleting
+        if self.in_txn:
+            self.conn.execute("ROLLBACK;")
+            self.in_txn = False
+        self.begin()
+        self.conn.execute("DELETE FROM data WHERE employee_id LIKE ?", [f"{WRITE_ID_PREFIX}%"])
+        self.commit()
+
+
+def run_phase(op) -> tuple[list[float], float, int]:
+    latencies: list[float] = []
+    rows = 0
+
+    t_start = now_s()
+    while len(latencies) < OPS_PER_PHASE and (now_s() - t_start) < PHASE_BUDGET_S:
+        t0 = now_s()
+        rows += op()
+        t1 = now_s()
+        latencies.append(t1 - t0)
+
+    return latencies, now_s() - t_start, rows
+
+def benchmark_engine(name: str, conn, rng: random.Random) -> None:
+    wl = Workload(conn, rng)
+    ops = [
+        ("point_lookup", wl.point_lookup),
+        ("employee_history", wl.employee_history),
+        ("range_scan", wl.range_scan),
+        ("insert_batch", wl.insert_batch),
+        ("update_batch", wl.update_batch),
+    ]
+
+    try:
+        for indexed in (False, True):
+            access = "index" if indexed else "no_index"
+
+            if indexed:
+                t0 = now_s()
+                conn.execute(f"CREATE INDEX {INDEX_NAME} ON data (employee_id);")
+                t1 = now_s()
+                log(f"{name} | create_index | seconds={(t1 - t0):.4f}")
+
+            for op_name, op in ops:
+                latencies, elapsed, rows = run_phase(op)
+                latencies.sort()
+                log(
+                    f"{name} | {access} | {op_name} | ops={len(latencies)} | ops_per_s={len(latencies) / elapsed:,.1f} "
+                    f"| p50={median(latencies) * 1e3:.3f}ms | p95={percentile(latencies, 0.95) * 1e3:.3f}ms "
+                    f"| p99={percentile(latencies, 0.99) * 1e3:.3f}ms | rows={rows}"
+                )
+    finally:
+        try:
+            wl.cleanup()
+        finally:
+            conn.execute(f"DROP INDEX IF EXISTS {INDEX_NAME};")
+
+
+def ensure_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute("PRAGMA synchronous=NORMAL;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA cache_size=-200000;")
+    conn.commit()
+
+
+def main() -> None:
+    if not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | oltp_benchmark_start")
+    log(f"meta | ops_per_phase={OPS_PER_PHASE} phase_budget_s={PHASE_BUDGET_S}")
+    log(f"meta | write_batch_rows={WRITE_BATCH_ROWS} range_width={RANGE_WIDTH}")
+
+    sqlite_conn = sqlite3.connect(SQLITE_PATH.as_posix())
+    ensure_sqlite_pragmas(sqlite_conn)
+
+    log("bench | start | engine=sqlite")
+    benchmark_engine("sqlite", sqlite_conn, random.Random(SEED))
+    sqlite_conn.close()
+
+    duck_conn = duckdb.connect(DUCKDB_PATH.as_posix())
+    duck_conn.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    log("bench | start | engine=duckdb")
+    benchmark_engine("duckdb", duck_conn, random.Random(SEED))
+    duck_conn.close()
+
+    log("meta | oltp_benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+if __name__ == "__main__":
+    main()
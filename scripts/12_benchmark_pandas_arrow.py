@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from statistics import median
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+ROOT = Path(__file__).resolve().parents[1]
+PARQUET_DIR = ROOT / "data" / "data_10m"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_pandas_arrow.log"
+
+WARMUP = 1
+REPEATS = 5
+
+# only the columns Q1-Q6 touch are loaded into pandas
+COLUMNS = [
+    "employee_id", "fullname", "company_name", "function", "year-month", "year",
+    "state_of_residence", "gender", "segmentation", "employee_type",
+    "salary_usd", "performance_score", "flag_leave", "flag_turnover", "is_promoted",
+]
+STRING_COLUMNS = [
+    "employee_id", "fullname", "company_name", "function", "year-month", "year",
+    "state_of_residence", "gender", "segmentation", "employee_type",
+]
+
+# numpy:       object-dtype strings (pandas default)
+# categorical: string columns converted to category
+# pyarrow:     ArrowDtype-backed columns (dtype_backend="pyarrow")
+PANDAS_VARIANTS = ["numpy", "categorical", "pyarrow"]
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+
+def load_pandas(variant: str) -> pd.DataFrame:
+    if variant == "pyarrow":
+        return pd.read_parquet(PARQUET_DIR, columns=COLUMNS, dtype_backend="pyarrow")
+
+    df = pd.read_parquet(PARQUET_DIR, columns=COLUMNS)
+    if variant == "categorical":
+        df[STRING_COLUMNS] = df[STRING_COLUMNS].astype("category")
+    return df
+
+
+def pd_q1_conditional_agg_rates(df: pd.DataFrame) -> pd.DataFrame:
+    base = df.loc[
+        df["year"].isin(["2022Y", "2023Y", "2024Y"]),
+        ["company_name", "function", "year-month", "state_of_residence", "gender", "segmentation",
+         "salary_usd", "performance_score", "flag_leave", "flag_turnover", "is_promoted"],
+    ].rename(columns={"year-month": "ym", "state_of_residence": "state"})
+    base["perf4"] = (base["performance_score"] >= 4).astype("int64")
+    base["promoted"] = (base["is_promoted"] == 1).astype("int64")
+
+    out = (
+        base.groupby(["company_name", "function", "ym", "state", "gender", "segmentation"], observed=True, sort=False)
+        .agg(
+            n=("salary_usd", "size"),
+            avg_salary=("salary_usd", "mean"),
+            avg_perf=("performance_score", "mean"),
+            cnt_perf4=("perf4", "sum"),
+            cnt_promoted=("promoted", "sum"),
+            sum_leave=("flag_leave", "sum"),
+            sum_turnover=("flag_turnover", "sum"),
+        )
+        .reset_index()
+    )
+    out["pct_perf4"] = out["cnt_perf4"] / out["n"]
+    out["promo_rate"] = out["cnt_promoted"] / out["n"]
+    out["leave_rate"] = out["sum_leave"] / out["n"]
+    out["turnover_rate"] = out["sum_turnover"] / out["n"]
+    return out.drop(columns=["cnt_perf4", "cnt_promoted", "sum_leave", "sum_turnover"])
+
+
+def pd_q2_distinct_counts(df: pd.DataFrame) -> pd.DataFrame:
+    base = df[df["state_of_residence"].isin(["California", "New York", "Florida"])]
+    return (
+        base.groupby(["year-month", "company_name"], observed=True, sort=False)
+        .agg(
+            rows=("employee_id", "size"),
+            distinct_employees=("employee_id", "nunique"),
+            distinct_names=("fullname", "nunique"),
+        )
+        .reset_index()
+    )
+
+
+def pd_q3_topN_per_group(df: pd.DataFrame) -> pd.DataFrame:
+    base = df.loc[
+        df["year"] == "2024Y",
+        ["company_name", "year-month", "employee_id", "salary_usd", "performance_score"],
+    ]
+    # ROW_NUMBER() ... <= 10: rank rows within each group after sorting by salary
+    top = base.sort_values("salary_usd", ascending=False)
+    top = top.assign(rn=top.groupby(["company_name", "year-month"], observed=True, sort=False).cumcount() + 1)
+    return top[top["rn"] <= 10]
+
+
+def pd_q4_running_total(df: pd.DataFrame) -> pd.DataFrame:
+    monthly = (
+        df.groupby(["company_name", "year-month"], observed=True)["salary_usd"]
+        .sum()
+        .rename("monthly_salary")
+        .reset_index()
+        .sort_values(["company_name", "year-month"])
+    )
+    monthly["cumulative_salary"] = monthly.groupby("company_name", observed=True)["monthly_salary"].cumsum()
+    return monthly
+
+
+def pd_q5_join_vs_avg(df: pd.DataFrame) -> pd.DataFrame:
+    base = df[["company_name", "year-month", "salary_usd"]]
+    avg_by_grp = (
+        base.groupby(["company_name", "year-month"], observed=True)["salary_usd"]
+        .mean()
+        .rename("avg_salary")
+        .reset_index()
+    )
+    joined = base.merge(avg_by_grp, on=["company_name", "year-month"], how="inner")
+    above = joined[joined["salary_usd"] > joined["avg_salary"]]
+    return above.groupby(["company_name", "year-month"], observed=True).size().rename("above_avg_count").reset_index()
+
+
+def pd_q6_selective_like_filter(df: pd.DataFrame) -> pd.DataFrame:
+    base = df[
+        (df["year"] == "2023Y")
+        & (df["state_of_residence"] == "California")
+        & (df["function"].str.contains("Sales", regex=False))
+        & (df["employee_type"] == "White-Collar")
+    ]
+    return (
+        base.groupby(["company_name", "function", "year-month"], observed=True, sort=False)
+        .agg(n=("salary_usd", "size"), avg_salary=("salary_usd", "mean"))
+        .reset_index()
+    )
+
+
+PANDAS_QUERIES = [
+    ("Q1_conditional_agg_rates", pd_q1_conditional_agg_rates),
+    ("Q2_distinct_counts", pd_q2_distinct_counts),
+    ("Q3_topN_per_group", pd_q3_topN_per_group),
+    ("Q4_running_total", pd_q4_running_total),
+    ("Q5_join_vs_avg", pd_q5_join_vs_avg),
+    ("Q6_selective_like_filter", pd_q6_selective_like_filter),
+]
+
+
+def dataset() -> ds.Dataset:
+    return ds.dataset(PARQUET_DIR, format="parquet")
+
+
+def pa_q1_conditional_agg_rates(dset: ds.Dataset) -> pa.Table:
+    keys = ["company_name", "function", "year-month", "state_of_residence", "gender", "segmentation"]
+    t = dset.to_table(
+        columns=keys + ["salary_usd", "performance_score", "flag_leave", "flag_turnover", "is_promoted"],
+        filter=pc.field("year").isin(["2022Y", "2023Y", "2024Y"]),
+    )
+    t = t.append_column("perf4", pc.cast(pc.greater_equal(t["performance_score"], 4), pa.int64()))
+    t = t.append_column("promoted", pc.cast(pc.equal(t["is_promoted"], 1), pa.int64()))
+
+    g = t.group_by(keys).aggregate([
+        ("salary_usd", "count"),
+        ("salary_usd", "mean"),
+        ("performance_score", "mean"),
+        ("perf4", "sum"),
+        ("promoted", "sum"),
+        ("flag_leave", "sum"),
+        ("flag_turnover", "sum"),
+    ])
+    n = g["salary_usd_count"]
+    for src, dst in [("perf4_sum", "pct_perf4"), ("promoted_sum", "promo_rate"),
+                     ("flag_leave_sum", "leave_rate"), ("flag_turnover_sum", "turnover_rate")]:
+        g = g.append_column(dst, pc.divide(pc.cast(g[src], pa.float64()), n))
+    return g.drop_columns(["perf4_sum", "promoted_sum", "flag_leave_sum", "flag_turnover_sum"])
+
+
+def pa_q2_distinct_counts(dset: ds.Dataset) -> pa.Table:
+    t = dset.to_table(
+        columns=["year-month", "company_name", "employee_id", "fullname"],
+        filter=pc.field("state_of_residence").isin(["California", "New York", "Florida"]),
+    )
+    return t.group_by(["year-month", "company_name"]).aggregate([
+        ("employee_id", "count"),
+        ("employee_id", "count_distinct"),
+        ("fullname", "count_distinct"),
+    ])
+
+
+def pa_q3_topN_per_group(dset: ds.Dataset) -> pa.Table:
+    keys = ["company_name", "year-month"]
+    t = dset.to_table(
+        columns=keys + ["employee_id", "salary_usd", "performance_score"],
+        filter=pc.field("year") == "2024Y",
+    )
+    # Acero has no window functions: sort so each group is contiguous and
+    # salary-descending, then take the first ten rows of every group
+    t = t.sort_by([("company_name", "ascending"), ("year-month", "ascending"), ("salary_usd", "descending")])
+    counts = t.group_by(keys, use_threads=False).aggregate([("salary_usd", "count")])["salary_usd_count"].to_numpy()
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    idx = np.concatenate([np.arange(s, s + min(c, 10)) for s, c in zip(starts, counts)])
+    rn = np.concatenate([np.arange(1, min(c, 10) + 1) for c in counts])
+    return t.take(pa.array(idx)).append_column("rn", pa.array(rn))
+
+
+def pa_q4_running_total(dset: ds.Dataset) -> pa.Table:
+    monthly = (
+        dset.to_table(columns=["company_name", "year-month", "salary_usd"])
+        .group_by(["company_name", "year-month"])
+        .aggregate([("salary_usd", "sum")])
+        .rename_columns(["company_name", "year-month", "monthly_salary"])
+        .sort_by([("company_name", "ascending"), ("year-month", "ascending")])
+    )
+    parts = []
+    for company in pc.unique(monthly["company_name"]):
+        part = monthly.filter(pc.equal(monthly["company_name"], company))
+        parts.append(part.append_column("cumulative_salary", pc.cumulative_sum(part["monthly_salary"])))
+    return pa.concat_tables(parts)
+
+
+def pa_q5_join_vs_avg(dset: ds.Dataset) -> pa.Table:
+    keys = ["company_name", "year-month"]
+    # one scan feeds both sides of the self-join
+    base = dset.to_table(columns=keys + ["salary_usd"])
+    avg_by_grp = base.group_by(keys).aggregate([("salary_usd", "mean")])
+
+    joined = base.join(avg_by_grp, keys=keys, join_type="inner")
+    above = joined.filter(pc.greater(joined["salary_usd"], joined["salary_usd_mean"]))
+    return above.group_by(keys).aggregate([("salary_usd", "count")])
+
+
+def pa_q6_selective_like_filter(dset: ds.Dataset) -> pa.Table:
+    t = dset.to_table(
+        columns=["company_name", "function", "year-month", "salary_usd"],
+        filter=(
+            (pc.field("year") == "2023Y")
+            & (pc.field("state_of_residence") == "California")
+            & pc.match_substring(pc.field("function"), "Sales")
+            & (pc.field("employee_type") == "White-Collar")
+        ),
+    )
+    return t.group_by(["company_name", "function", "year-month"]).aggregate([
+        ("salary_usd", "count"),
+        ("salary_usd", "mean"),
+    ])
+
+
+ARROW_QUERIES = [
+    ("Q1_conditional_agg_rates", pa_q1_conditional_agg_rates),
+    ("Q2_distinct_counts", pa_q2_distinct_counts),
+    ("Q3_topN_per_group", pa_q3_topN_per_group),
+    ("Q4_running_total", pa_q4_running_total),
+    ("Q5_join_vs_avg", pa_q5_join_vs_avg),
+    ("Q6_selective_like_filter", pa_q6_selective_like_filter),
+]
+
+
+def benchmark_engine(name: str, source, queries) -> None:
+    for qname, qfn in queries:
+        for _ in range(WARMUP):
+            _ = len(qfn(source))
+
+        times: list[float] = []
+        last_rows: int = 0
+
+        for _ in range(REPEATS):
+            t0 = now_s()
+            last_rows = len(qfn(source))
+            t1 = now_s()
+            times.append(t1 - t0)
+
+        med = median(times)
+        log(f"{name} | {qname} | {med:.4f}s | rows={last_rows}")
+
+
+def main() -> None:
+    if not PARQUET_DIR.exists():
+        raise FileNotFoundError(f"Parquet dataset dir not found: {PARQUET_DIR}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | benchmark_start")
+    log(f"meta | warmup={WARMUP} repeats={REPEATS}")
+    log(f"meta | parquet_dir={PARQUET_DIR}")
+    log(f"meta | pandas_variants={','.join(PANDAS_VARIANTS)}")
+
+    for variant in PANDAS_VARIANTS:
+        name = f"pandas_{variant}"
+        t0 = now_s()
+        df = load_pandas(variant)
+        t1 = now_s()
+        mb = df.memory_usage(deep=True).sum() / 1e6
+        log(f"{name} | load | seconds={(t1 - t0):.4f} | rows={len(df)} | mb={mb:.1f}")
+
+        log(f"bench | start | engine={name}")
+        benchmark_engine(name, df, PANDAS_QUERIES)
+        del df
+
+    dset = dataset()
+    t0 = now_s()
+    n = dset.count_rows()
+    t1 = now_s()
+    log(f"verify | rowcount | pyarrow={n} | seconds={(t1 - t0):.4f}")
+
+    log("bench | start | engine=pyarrow_dataset")
+    benchmark_engine("pyarrow_dataset", dset, ARROW_QUERIES)
+
+    log("meta | benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+
+if __name__ == "__main__":
+    main()
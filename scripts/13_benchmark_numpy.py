@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import importlib
+import math
+import time
+from decimal import Decimal
+from pathlib import Path
+from statistics import median
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from queries import QUERIES
+
+gen = importlib.import_module("01_generate_data")
+
+ROOT = Path(__file__).resolve().parents[1]
+PARQUET_DIR = ROOT / "data" / "data_10m"
+NUMPY_DIR = ROOT / "data" / "numpy_10m"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_numpy.log"
+
+WARMUP = 1
+REPEATS = 5
+DUCKDB_THREADS = 4
+TOP_N = 10
+REL_TOL = 1e-6
+
+# string column -> value domain in 01_generate_data.py; codes follow sorted
+# order so comparisons on codes match comparisons on the strings
+ENCODED = {
+    "company_name": "COMPANY",
+    "function": "FUNCTION",
+    "year-month": "YEAR_MONTH",
+    "state_of_residence": "STATES",
+    "gender": "GENDER",
+    "segmentation": "SEGMENT",
+    "year": "YEAR",
+    "employee_type": "EMPLOYEE_TYPE",
+}
+# no generator domain; the dictionary is taken from the data
+LEARNED = ["fullname"]
+NUMERIC = {
+    "salary_usd": np.float64,
+    "performance_score": np.float64,
+    "flag_leave": np.int8,
+    "flag_turnover": np.int8,
+    "is_promoted": np.int8,
+}
+
+# result column -> encoded source column, used to decode results for verification
+RESULT_KEYS = {
+    "company_name": "company_name",
+    "function": "function",
+    "ym": "year-month",
+    "state": "state_of_residence",
+    "gender": "gender",
+    "segmentation": "segmentation",
+}
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+
+class Store:
+    """Dictionary-coded columns of the dataset, memory-mapped from .npy files."""
+
+    def __init__(self, cols: dict[str, np.ndarray], domains: dict[str, np.ndarray]):
+        self.cols = cols
+        self.domains = domains
+
+    def __getitem__(self, col: str) -> np.ndarray:
+        return self.cols[col]
+
+    def card(self, col: str) -> int:
+        return len(self.domains[col])
+
+    def code(self, col: str, value: str) -> int:
+        i = int(np.searchsorted(self.domains[col], value))
+        if i >= len(self.domains[col]) or self.domains[col][i] != value:
+            raise KeyError(f"{value!r} not in domain of {col}")
+        return i
+
+    def lut(self, col: str, values: list[str]) -> np.ndarray:
+        out = np.zeros(self.card(col), dtype=bool)
+        out[[self.code(col, v) for v in values]] = True
+        return out
+
+
+def npy_path(col: str, kind: str = "codes") -> Path:
+    return NUMPY_DIR / f"{col.replace('-', '_')}.{kind}.npy"
+
+def code_dtype(card: int):
+    return np.int8 if card <= 127 else np.int16 if card <= 32_767 else np.int32
+
+def cache_is_fresh(parts: list[Path]) -> bool:
+    files = [npy_path(c) for c in list(ENCODED) + LEARNED + list(NUMERIC) + ["employee_id"]]
+    if not all(f.exists() for f in files):
+        return False
+    newest_part = max(p.stat().st_mtime for p in parts)
+    return min(f.stat().st_mtime for f in files) > newest_part
+
+def read_column(col: str) -> pa.ChunkedArray:
+    return pq.read_table(PARQUET_DIR, columns=[col]).column(col)
+
+def build_cache() -> None:
+    NUMPY_DIR.mkdir(parents=True, exist_ok=True)
+
+    for col, domain_name in ENCODED.items():
+        domain = np.unique(getattr(gen, domain_name).astype(str))
+        codes = pc.index_in(read_column(col), value_set=pa.array(domain.tolist()))
+        if codes.null_count:
+            raise ValueError(f"{col} has values outside {domain_name}")
+        np.save(npy_path(col, "domain"), domain)
+        np.save(npy_path(col), codes.to_numpy().astype(code_dtype(len(domain))))
+
+    for col in LEARNED:
+        values = read_column(col)
+        domain = np.sort(pc.unique(values).to_numpy(zero_copy_only=False).astype(str))
+        codes = pc.index_in(values, value_set=pa.array(domain.tolist()))
+        np.save(npy_path(col, "domain"), domain)
+        np.save(npy_path(col), codes.to_numpy().astype(code_dtype(len(domain))))
+
+    # "E000123" -> 123
+    emp = pc.cast(pc.utf8_slice_codeunits(read_column("employee_id"), 1), pa.int32())
+    np.save(npy_path("employee_id"), emp.to_numpy())
+
+    for col, dtype in NUMERIC.items():
+        np.save(npy_path(col), read_column(col).to_numpy().astype(dtype))
+
+def load_store() -> Store:
+    cols = {}
+    domains = {}
+    for col in list(ENCODED) + LEARNED:
+        cols[col] = np.load(npy_path(col), mmap_mode="r")
+        domains[col] = np.load(npy_path(col, "domain"))
+    for col in list(NUMERIC) + ["employee_id"]:
+        cols[col] = np.load(npy_path(col), mmap_mode="r")
+    return Store(cols, domains)
+
+
+def group_key(st: Store, keys: list[str], sel: np.ndarray | None = None) -> tuple[np.ndarray, tuple[int, ...]]:
+    dims = tuple(st.card(c) for c in keys)
+    codes = [st[c] if sel is None else st[c][sel] for c in keys]
+    return np.ravel_multi_index(codes, dims), dims
+
+def group_columns(groups: np.ndarray, dims: tuple[int, ...], names: list[str]) -> dict[str, np.ndarray]:
+    return dict(zip(names, np.unravel_index(groups, dims)))
+
+
+def q1_conditional_agg_rates(st: Store) -> dict[str, np.ndarray]:
+    sel = st.lut("year", ["2022Y", "2023Y", "2024Y"])[st["year"]]
+    keys = ["company_name", "function", "year-month", "state_of_residence", "gender", "segmentation"]
+    key, dims = group_key(st, keys, sel)
+    size = math.prod(dims)
+
+    perf = st["performance_score"][sel]
+    n = np.bincount(key, minlength=size)
+    sum_salary = np.bincount(key, weights=st["salary_usd"][sel], minlength=size)
+    sum_perf = np.bincount(key, weights=perf, minlength=size)
+    cnt_perf4 = np.bincount(key[perf >= 4], minlength=size)
+    cnt_promoted = np.bincount(key[st["is_promoted"][sel] == 1], minlength=size)
+    sum_leave = np.bincount(key, weights=st["flag_leave"][sel], minlength=size)
+    sum_turnover = np.bincount(key, weights=st["flag_turnover"][sel], minlength=size)
+
+    g = np.flatnonzero(n)
+    out = group_columns(g, dims, ["company_name", "function", "ym", "state", "gender", "segmentation"])
+    ng = n[g]
+    out["n"] = ng
+    out["avg_salary"] = sum_salary[g] / ng
+    out["avg_perf"] = sum_perf[g] / ng
+    out["pct_perf4"] = cnt_perf4[g] / ng
+    out["promo_rate"] = cnt_promoted[g] / ng
+    out["leave_rate"] = sum_leave[g] / ng
+    out["turnover_rate"] = sum_turnover[g] / ng
+    return out
+
+
+def distinct_per_group(key: np.ndarray, values: np.ndarray, card: int, size: int) -> np.ndarray:
+    pairs = np.unique(key * card + values)
+    return np.bincount(pairs // card, minlength=size)
+
+def q2_distinct_counts(st: Store) -> dict[str, np.ndarray]:
+    sel = st.lut("state_of_residence", ["California", "New York", "Florida"])[st["state_of_residence"]]
+    key, dims = group_key(st, ["year-month", "company_name"], sel)
+    size = math.prod(dims)
+
+    n = np.bincount(key, minlength=size)
+    emp_card = int(st["employee_id"].max()) + 1
+    distinct_emp = distinct_per_group(key, st["employee_id"][sel].astype(np.int64), emp_card, size)
+    distinct_names = distinct_per_group(key, st["fullname"][sel].astype(np.int64), st.card("fullname"), size)
+
+    g = np.flatnonzero(n)
+    out = group_columns(g, dims, ["ym", "company_name"])
+    out["rows"] = n[g]
+    out["distinct_employees"] = distinct_emp[g]
+    out["distinct_names"] = distinct_names[g]
+    return out
+
+
+def q3_topN_per_group(st: Store) -> dict[str, np.ndarray]:
+    rows = np.flatnonzero(st["year"] == st.code("year", "2024Y"))
+    key, dims = group_key(st, ["company_name", "year-month"], rows)
+    salary = st["salary_usd"][rows]
+
+    order = np.argsort(key, kind="stable")
+    counts = np.bincount(key, minlength=math.prod(dims))
+    ends = np.cumsum(counts)
+
+    picked: list[np.ndarray] = []
+    groups: list[np.ndarray] = []
+    ranks: list[np.ndarray] = []
+    for g in np.flatnonzero(counts):
+        members = order[ends[g] - counts[g]:ends[g]]
+        if len(members) > TOP_N:
+            members = members[np.argpartition(-salary[members], TOP_N - 1)[:TOP_N]]
+        members = members[np.argsort(-salary[members])]
+        picked.append(members)
+        groups.append(np.full(len(members), g))
+        ranks.append(np.arange(1, len(members) + 1))
+
+    idx = np.concatenate(picked)
+    src = rows[idx]
+    out = group_columns(np.concatenate(groups), dims, ["company_name", "ym"])
+    out["employee_id"] = st["employee_id"][src]
+    out["salary_usd"] = salary[idx]
+    out["performance_score"] = st["performance_score"][src]
+    out["rn"] = np.concatenate(ranks)
+    return out
+
+
+def q4_running_total(st: Store) -> dict[str, np.ndarray]:
+    key, dims = group_key(st, ["company_name", "year-month"])
+    size = math.prod(dims)
+
+    monthly = np.bincount(key, weights=st["salary_usd"], minlength=size).reshape(dims)
+    present = np.bincount(key, minlength=size).reshape(dims) > 0
+    # absent months contribute zero, so a plain cumsum along the month axis matches the window
+    cumulative = np.cumsum(monthly, axis=1)
+
+    g = np.flatnonzero(present.ravel())
+    out = group_columns(g, dims, ["company_name", "ym"])
+    out["monthly_salary"] = monthly.ravel()[g]
+    out["cumulative_salary"] = cumulative.ravel()[g]
+    return out
+
+
+def q5_join_vs_avg(st: Store) -> dict[str, np.ndarray]:
+    key, dims = group_key(st, ["company_name", "year-month"])
+    size = math.prod(dims)
+
+    salary = st["salary_usd"]
+    n = np.bincount(key, minlength=size)
+    avg = np.bincount(key, weights=salary, minlength=size) / np.maximum(n, 1)
+    above = np.bincount(key[salary > avg[key]], minlength=size)
+
+    g = np.flatnonzero(above)
+    out = group_columns(g, dims, ["company_name", "ym"])
+    out["above_avg_count"] = above[g]
+    return out
+
+
+def q6_selective_like_filter(st: Store) -> dict[str, np.ndarray]:
+    sales = np.char.find(st.domains["function"], "Sales") >= 0
+    sel = (
+        (st["year"] == st.code("year", "2023Y"))
+        & (st["state_of_residence"] == st.code("state_of_residence", "California"))
+        & sales[st["function"]]
+        & (st["employee_type"] == st.code("employee_type", "White-Collar"))
+    )
+    key, dims = group_key(st, ["company_name", "function", "year-month"], sel)
+    size = math.prod(dims)
+
+    n = np.bincount(key, minlength=size)
+    sum_salary = np.bincount(key, weights=st["salary_usd"][sel], minlength=size)
+
+    g = np.flatnonzero(n)
+    out = group_columns(g, dims, ["company_name", "function", "ym"])
+    out["n"] = n[g]
+    out["avg_salary"] = sum_salary[g] / n[g]
+    return out
+
+
+KERNELS = {
+    "Q1_conditional_agg_rates": q1_conditional_agg_rates,
+    "Q2_distinct_counts": q2_distinct_counts,
+    "Q3_topN_per_group": q3_topN_per_group,
+    "Q4_running_total": q4_running_total,
+    "Q5_join_vs_avg": q5_join_vs_avg,
+    "Q6_selective_like_filter": q6_selective_like_filter,
+}
+
+
+def decode_rows(st: Store, out: dict[str, np.ndarray]) -> list[tuple]:
+    cols = []
+    for name, arr in out.items():
+        if name in RESULT_KEYS:
+            cols.append(st.domains[RESULT_KEYS[name]][arr].tolist())
+        elif name == "employee_id":
+            cols.append([f"E{v:06d}" for v in arr.tolist()])
+        else:
+            cols.append(arr.tolist())
+    return list(zip(*cols))
+
+def normalize(row: tuple) -> tuple:
+    return tuple(float(v) if isinstance(v, (float, Decimal)) else v for v in row)
+
+def sort_key(row: tuple) -> tuple:
+    return tuple(round(v, 6) if isinstance(v, float) else v for v in row)
+
+def same_rows(got: list[tuple], expected: list[tuple]) -> bool:
+    if len(got) != len(expected):
+        return False
+    got = sorted((normalize(r) for r in got), key=sort_key)
+    expected = sorted((normalize(r) for r in expected), key=sort_key)
+    for a, b in zip(got, expected):
+        for x, y in zip(a, b):
+            if isinstance(x, float) or isinstance(y, float):
+                if not math.isclose(x, y, rel_tol=REL_TOL):
+                    return False
+            elif x != y:
+                return False
+    return True
+
+
+def benchmark_engine(name: str, st: Store, verified: set[str]) -> None:
+    for qname, kernel in KERNELS.items():
+        # a kernel that disagrees with DuckDB has no comparable timing
+        if qname not in verified:
+            log(f"{name} | {qname} | skipped: failed verification")
+            continue
+
+        for _ in range(WARMUP):
+            _ = kernel(st)
+
+        times: list[float] = []
+        last_rows: int = 0
+
+        for _ in range(REPEATS):
+            t0 = now_s()
+            out = kernel(st)
+            t1 = now_s()
+            times.append(t1 - t0)
+            last_rows = len(next(iter(out.values())))
+
+        med = median(times)
+        log(f"{name} | {qname} | {med:.4f}s | rows={last_rows}")
+
+def verify(st: Store) -> set[str]:
+    con = duckdb.connect(DUCKDB_PATH.as_posix(), read_only=True)
+    con.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    verified: set[str] = set()
+    for qname, sql in QUERIES:
+        expected = con.execute(sql).fetchall()
+        got = decode_rows(st, KERNELS[qname](st))
+        ok = same_rows(got, expected)
+        if ok:
+            verified.add(qname)
+        log(f"verify | {qname} | numpy={len(got)} duckdb={len(expected)} | {'ok' if ok else 'MISMATCH'}")
+
+    con.close()
+    return verified
+
+
+def main() -> None:
+    parts = sorted(PARQUET_DIR.glob("part_*.parquet"))
+    if not parts:
+        raise FileNotFoundError(f"No parquet parts found in: {PARQUET_DIR}")
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | benchmark_start")
+    log(f"meta | warmup={WARMUP} repeats={REPEATS}")
+    log(f"meta | numpy_dir={NUMPY_DIR}")
+
+    if cache_is_fresh(parts):
+        log("meta | numpy_cache=fresh")
+    else:
+        t0 = now_s()
+        build_cache()
+        t1 = now_s()
+        log(f"numpy_sol | build_cache | seconds={(t1 - t0):.4f}")
+
+    st = load_store()
+    log(f"verify | rowcount | numpy={len(st['salary_usd'])}")
+
+    verified = verify(st)
+
+    log("bench | start | engine=numpy_sol")
+    benchmark_engine("numpy_sol", st, verified)
+
+    log("meta | benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from statistics import median
+
+from queries import QUERIES
+
+ROOT = Path(__file__).resolve().parents[1]
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+MATRIX_DIR = ROOT / "db" / "sqlite_matrix"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "sqlite_matrix.log"
+
+WARMUP = 1
+REPEATS = 3
+BATCH_ROWS = 50_000
+MMAP_BYTES = 1 << 34
+
+# (name, layout, page_size); every build is copied from db/sqlite.db
+BUILDS: list[tuple[str, str, int]] = [
+    ("rowid_p4k", "rowid", 4096),
+    ("rowid_p16k", "rowid", 16384),
+    ("rowid_p64k", "rowid", 65536),
+    ("strict_p4k", "strict", 4096),
+    ("clustered_p4k", "without_rowid", 4096),
+    ("trimmed_p4k", "trimmed", 4096),
+]
+
+# disk: plain reads, disk_mmap: PRAGMA mmap_size, memory: backup-API copy into :memory:
+RUNTIMES = ["disk", "disk_mmap", "memory"]
+
+CLUSTER_KEY = ["company_name", "year-month", "employee_id"]
+# (company_name, "year-month", employee_id) repeats in the generated data, so the
+# clustered layout appends the source rowid to make the primary key unique
+CLUSTER_SEQ = "seq"
+
+# columns Q1-Q6 read; everything else is dropped in the trimmed layout
+TRIMMED_COLUMNS = [
+    "employee_id", "fullname", "company_name", "function", "year-month", "year",
+    "state_of_residence", "gender", "segmentation", "employee_type",
+    "salary_usd", "performance_score", "flag_leave", "flag_turnover", "is_promoted",
+]
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+def quote_col(c: str) -> str:
+    return f'"{c}"' if ("-" in c or " " in c) else c
+
+def strip_trailing_semicolon(sql: str) -> str:
+    s = sql.strip()
+    if s.endswith(";"):
+        s = s[:-1].rstrip()
+    return s
+
+def wrap_count(sql: str) -> str:
+    inner = strip_trailing_semicolon(sql)
+    return f"SELECT COUNT(*) FROM ({inner}) t;"
+
+
+def source_columns() -> list[tuple[str, str]]:
+    con = sqlite3.connect(SQLITE_PATH.as_posix())
+    cols = [(r[1], r[2]) for r in con.execute("PRAGMA table_info(data)").fetchall()]
+    con.close()
+    return cols
+
+def table_ddl(layout: str, cols: list[tuple[str, str]]) -> str:
+    if layout == "trimmed":
+        cols = [c for c in cols if c[0] in TRIMMED_COLUMNS]
+
+    defs = [f"{quote_col(name)} {ctype}" for name, ctype in cols]
+    suffix = ""
+    if layout == "strict":
+        suffix = " STRICT"
+    elif layout == "without_rowid":
+        defs.append(f"{CLUSTER_SEQ} INTEGER")
+        pk = ", ".join(quote_col(c) for c in CLUSTER_KEY + [CLUSTER_SEQ])
+        defs.append(f"PRIMARY KEY ({pk})")
+        suffix = " WITHOUT ROWID"
+
+    return "CREATE TABLE data (\n    " + ",\n    ".join(defs) + f"\n){suffix};"
+
+def copy_sql(layout: str, cols: list[tuple[str, str]]) -> str:
+    names = [name for name, _ in cols if layout != "trimmed" or name in TRIMMED_COLUMNS]
+    col_list = ", ".join(quote_col(c) for c in names)
+    if layout == "without_rowid":
+        order = ", ".join(quote_col(c) for c in CLUSTER_KEY)
+        return (
+            f"INSERT INTO data ({col_list}, {CLUSTER_SEQ}) "
+            f"SELECT {col_list}, rowid FROM src.data ORDER BY {order}, rowid;"
+        )
+    return f"INSERT INTO data ({col_list}) SELECT {col_list} FROM src.data;"
+
+
+def remove_db(path: Path) -> None:
+    for p in [path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")]:
+        if p.exists():
+            p.unlink()
+
+def build(name: str, layout: str, page_size: int, cols: list[tuple[str, str]]) -> Path:
+    path = MATRIX_DIR / f"{name}.db"
+    remove_db(path)
+
+    con = sqlite3.connect(path.as_posix())
+    cur = con.cursor()
+    # page_size only takes effect before the first table is created
+    cur.execute(f"PRAGMA page_size={page_size};")
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute("PRAGMA synchronous=NORMAL;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA cache_size=-200000;")
+    cur.execute(table_ddl(layout, cols))
+    con.commit()
+
+    cur.execute(f"ATTACH DATABASE '{SQLITE_PATH.as_posix()}' AS src;")
+
+    t0 = now_s()
+    cur.execute("BEGIN;")
+    cur.execute(copy_sql(layout, cols))
+    con.commit()
+    t1 = now_s()
+
+    cur.execute("DETACH DATABASE src;")
+    cur.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+    actual_page = cur.execute("PRAGMA page_size;").fetchone()[0]
+    con.close()
+
+    log(
+        f"{name} | load | seconds={(t1 - t0):.4f} | layout={layout} | page_size={actual_page} "
+        f"| file_mb={path.stat().st_size / 1e6:.1f}"
+    )
+    return path
+
+
+def open_runtime(path: Path, runtime: str) -> sqlite3.Connection:
+    disk = sqlite3.connect(path.as_posix())
+    disk.execute("PRAGMA temp_store=MEMORY;")
+    disk.execute("PRAGMA cache_size=-200000;")
+
+    if runtime == "disk_mmap":
+        disk.execute(f"PRAGMA mmap_size={MMAP_BYTES};")
+    if runtime != "memory":
+        return disk
+
+    mem = sqlite3.connect(":memory:")
+    t0 = now_s()
+    disk.backup(mem)
+    t1 = now_s()
+    disk.close()
+
+    mem.execute("PRAGMA temp_store=MEMORY;")
+    log(f"{path.stem} | memory | backup_copy | seconds={(t1 - t0):.4f}")
+    return mem
+
+def run_count(conn: sqlite3.Connection, sql: str) -> int:
+    out = conn.execute(wrap_count(sql)).fetchone()
+    return int(out[0]) if out else 0
+
+def select_star_stream(conn: sqlite3.Connection) -> int:
+    cur = conn.execute("SELECT * FROM data;")
+    total = 0
+    while True:
+        batch = cur.fetchmany(BATCH_ROWS)
+        if not batch:
+            break
+        total += len(batch)
+    return total
+
+def time_runner(runner) -> tuple[float, int]:
+    for _ in range(WARMUP):
+        _ = runner()
+
+    times: list[float] = []
+    last_rows: int = 0
+
+    for _ in range(REPEATS):
+        t0 = now_s()
+        last_rows = runner()
+        t1 = now_s()
+        times.append(t1 - t0)
+
+    return median(times), last_rows
+
+
+def main() -> None:
+    if not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+
+    MATRIX_DIR.mkdir(parents=True, exist_ok=True)
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | sqlite_matrix_start")
+    log(f"meta | warmup={WARMUP} repeats={REPEATS}")
+    log(f"meta | builds={','.join(b[0] for b in BUILDS)}")
+    log(f"meta | runtimes={','.join(RUNTIMES)}")
+    log("meta | best read_select_star excludes the trimmed layout")
+
+    cols = source_columns()
+    workload = [(qname, lambda c, q=sql: run_count(c, q)) for qname, sql in QUERIES]
+    workload.append(("read_select_star", select_star_stream))
+
+    results: dict[str, list[tuple[float, str]]] = {qname: [] for qname, _ in workload}
+
+    for name, layout, page_size in BUILDS:
+        path = build(name, layout, page_size, cols)
+
+        for runtime in RUNTIMES:
+            log(f"bench | start | build={name} | runtime={runtime}")
+            conn = open_runtime(path, runtime)
+            for qname, fn in workload:
+                seconds, rows = time_runner(lambda: fn(conn))
+                log(f"{name} | {runtime} | {qname} | {seconds:.4f}s | rows={rows}")
+                # SELECT * on the trimmed layout returns fewer columns, not the same rows faster
+                if qname == "read_select_star" and layout == "trimmed":
+                    continue
+                results[qname].append((seconds, f"{name}/{runtime}"))
+            conn.close()
+
+        # every build is a full copy of the table; keep only one on disk at a time
+        remove_db(path)
+
+    for qname, timings in results.items():
+        seconds, config = min(timings)
+        log(f"best | {qname} | {config} | {seconds:.4f}s")
+
+    log("meta | sqlite_matrix_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+from queries import QUERIES
+
+ROOT = Path(__file__).resolve().parents[1]
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+PARQUET_DIR = ROOT / "data" / "data_10m"
+SPILL_DIR = ROOT / "spill"
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_memory.log"
+
+WARMUP = 1
+REPEATS = 3
+DUCKDB_THREADS = 4
+POLARS_THREADS = 4
+
+# hard RSS caps as fractions of the data each engine reads (duckdb.db for DuckDB,
+# the Parquet parts for Polars), so every run has to work out of core
+BUDGET_FRACTIONS = [0.5, 0.25, 0.125, 0.0625]
+# below this the interpreter and engine alone do not fit
+MIN_BUDGET_MB = 128
+# DuckDB's memory_limit only covers its buffer manager, so leave headroom under the RSS cap
+DUCKDB_LIMIT_FRACTION = 0.75
+POLL_S = 0.05
+TIMEOUT_S = 900.0
+STDERR_TAIL_LINES = 5
+
+ENGINES = ["duckdb", "polars_streaming"]
+
+# exit codes of the child process
+EXIT_OOM = 3
+EXIT_ERROR = 4
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+def strip_trailing_semicolon(sql: str) -> str:
+    s = sql.strip()
+    if s.endswith(";"):
+        s = s[:-1].rstrip()
+    return s
+
+def wrap_count(sql: str) -> str:
+    inner = strip_trailing_semicolon(sql)
+    return f"SELECT COUNT(*) FROM ({inner}) t;"
+
+
+def time_runner(runner) -> tuple[float, int]:
+    for _ in range(WARMUP):
+        _ = runner()
+
+    times: list[float] = []
+    last_rows: int = 0
+
+    for _ in range(REPEATS):
+        t0 = now_s()
+        last_rows = runner()
+        t1 = now_s()
+        times.append(t1 - t0)
+
+    return median(times), last_rows
+
+# imports and connections happen before time_runner, so only the query is timed
+def child_duckdb(qname: str, budget_mb: int, spill: Path) -> tuple[float, int]:
+    import duckdb
+
+    sql = wrap_count(dict(QUERIES)[qname])
+    con = duckdb.connect(DUCKDB_PATH.as_posix(), read_only=True, config={
+        "threads": DUCKDB_THREADS,
+        "memory_limit": f"{int(budget_mb * DUCKDB_LIMIT_FRACTION)}MB",
+        "temp_directory": spill.as_posix(),
+    })
+    try:
+        return time_runner(lambda: int(con.execute(sql).fetchone()[0]))
+    except duckdb.OutOfMemoryException:
+        sys.exit(EXIT_OOM)
+    finally:
+        con.close()
+
+def child_polars(qname: str) -> tuple[float, int]:
+    import polars as pl
+
+    qfn = dict(importlib.import_module("05_benchmark_polars").QUERIES)[qname]
+    lf = pl.scan_parquet((PARQUET_DIR / "*.parquet").as_posix())
+    # an allocation failure aborts the process; run_limited reports it as engine_oom
+    return time_runner(lambda: int(qfn(lf).select(pl.len()).collect(streaming=True).item()))
+
+def child_main(engine: str, qname: str, budget_mb: int, spill: Path) -> None:
+    try:
+        if engine == "duckdb":
+            seconds, rows = child_duckdb(qname, budget_mb, spill)
+        else:
+            seconds, rows = child_polars(qname)
+    except SystemExit:
+        raise
+    except Exception as e:  # report, the parent records the failure
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}), flush=True)
+        sys.exit(EXIT_ERROR)
+    print(json.dumps({"seconds": seconds, "rows": rows}), flush=True)
+
+
+def rss_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except FileNotFoundError:
+        pass
+    return 0.0
+
+def dir_bytes(path: Path) -> int:
+    total = 0
+    for p in path.rglob("*"):
+        try:
+            if p.is_file():
+                total += p.stat().st_size
+        except FileNotFoundError:
+            # spill files come and go while we walk
+            pass
+    return total
+
+def run_limited(engine: str, qname: str, budget_mb: int) -> dict[str, object]:
+    """Run one query in a child process, killing it if its RSS exceeds the budget."""
+    spill = SPILL_DIR / f"{engine}_{qname}_{budget_mb}"
+    if spill.exists():
+        shutil.rmtree(spill)
+    spill.mkdir(parents=True)
+    # stderr goes to a file next to the spill directory: a pipe nobody reads
+    # could fill up and block the child
+    stderr_path = SPILL_DIR / f"{spill.name}.stderr"
+
+    env = dict(os.environ)
+    env["POLARS_MAX_THREADS"] = str(POLARS_THREADS)
+    env["POLARS_TEMP_DIR"] = spill.as_posix()
+
+    with open(stderr_path, "w", encoding="utf-8") as err:
+        proc = subprocess.Popen(
+            [sys.executable, __file__, "--child", engine, qname, str(budget_mb), spill.as_posix()],
+            stdout=subprocess.PIPE, stderr=err, env=env, text=True,
+        )
+
+        peak_rss = 0.0
+        peak_spill = 0
+        status = None
+        t0 = now_s()
+        while proc.poll() is None:
+            peak_rss = max(peak_rss, rss_mb(proc.pid))
+            peak_spill = max(peak_spill, dir_bytes(spill))
+            if peak_rss > budget_mb:
+                proc.kill()
+                status = "rss_killed"
+            elif now_s() - t0 > TIMEOUT_S:
+                proc.kill()
+                status = "timeout"
+            time.sleep(POLL_S)
+
+    out = proc.stdout.read().strip().splitlines() if proc.stdout else []
+    result = json.loads(out[-1]) if out else {}
+    stderr_tail = stderr_path.read_text(encoding="utf-8", errors="replace").splitlines()[-STDERR_TAIL_LINES:]
+    stderr_path.unlink()
+    shutil.rmtree(spill, ignore_errors=True)
+
+    if status is None:
+        if proc.returncode == 0:
+            status = "ok"
+        elif proc.returncode == EXIT_OOM:
+            status = "engine_oom"
+        elif proc.returncode == -signal.SIGABRT or any("memory allocation" in line for line in stderr_tail):
+            # Polars aborts in Rust when an allocation fails instead of raising MemoryError
+            status = "engine_oom"
+        else:
+            status = "error"
+
+    return {
+        "status": status,
+        "seconds": result.get("seconds"),
+        "rows": result.get("rows"),
+        "error": result.get("error"),
+        "stderr_tail": stderr_tail,
+        "peak_rss_mb": peak_rss,
+        "spill_mb": peak_spill / 1e6,
+    }
+
+
+def main() -> None:
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+    parts = sorted(PARQUET_DIR.glob("part_*.parquet"))
+    if not parts:
+        raise FileNotFoundError(f"No parquet parts found in: {PARQUET_DIR}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    data_mb = sum(p.stat().st_size for p in parts) / 1e6
+    db_mb = DUCKDB_PATH.stat().st_size / 1e6
+    footprint_mb = {"duckdb": db_mb, "polars_streaming": data_mb}
+
+    log("meta | memory_benchmark_start")
+    log(f"meta | warmup={WARMUP} repeats={REPEATS}")
+    log(
+        f"meta | budget_fractions={','.join(f'{f:g}' for f in BUDGET_FRACTIONS)} min_budget_mb={MIN_BUDGET_MB} "
+        f"duckdb_limit_fraction={DUCKDB_LIMIT_FRACTION}"
+    )
+    log(f"meta | parquet_mb={data_mb:.1f} duckdb_db_mb={db_mb:.1f}")
+    log(f"meta | rss polled every {POLL_S * 1e3:.0f}ms; a run above its budget is killed")
+
+    for engine in ENGINES:
+        budgets = sorted({max(MIN_BUDGET_MB, int(footprint_mb[engine] * f)) for f in BUDGET_FRACTIONS}, reverse=True)
+        log(f"bench | start | engine={engine} | footprint_mb={footprint_mb[engine]:.1f} | budgets_mb={','.join(map(str, budgets))}")
+        for qname, _ in QUERIES:
+            for budget_mb in budgets:
+                r = run_limited(engine, qname, budget_mb)
+                seconds = f"{r['seconds']:.4f}s" if r["seconds"] is not None else "-"
+                line = (
+                    f"{engine} | {qname} | budget_mb={budget_mb} | status={r['status']} | {seconds} "
+                    f"| peak_rss_mb={r['peak_rss_mb']:.0f} | spill_mb={r['spill_mb']:.1f} | rows={r['rows']}"
+                )
+                if r["error"]:
+                    line += f" | error={r['error']}"
+                log(line)
+                if r["status"] != "ok":
+                    for err_line in r["stderr_tail"]:
+                        log(f"{engine} | {qname} | budget_mb={budget_mb} | stderr | {err_line}")
+
+    log("meta | memory_benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child_main(sys.argv[2], sys.argv[3], int(sys.argv[4]), Path(sys.argv[5]))
+    else:
+        main()
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import importlib
+import math
+import random
+import re
+import sqlite3
+import time
+from pathlib import Path
+from statistics import median
+
+import duckdb
+import polars as pl
+
+from queries import QUERIES
+
+polars_bench = importlib.import_module("05_benchmark_polars")
+
+ROOT = Path(__file__).resolve().parents[1]
+SQLITE_PATH = ROOT / "db" / "sqlite.db"
+DUCKDB_PATH = ROOT / "db" / "duckdb.db"
+PARQUET_DIR = ROOT / "data" / "data_10m"
+PARQUET_GLOB = (PARQUET_DIR / "*.parquet").as_posix()
+
+LOG_DIR = ROOT / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_PATH = LOG_DIR / "benchmark_approx.log"
+
+WARMUP = 1
+REPEATS = 3
+DUCKDB_THREADS = 4
+SAMPLE_SEED = 42
+
+SAMPLE_RATES = [0.01, 0.05, 0.1]
+
+# SQLite and Polars have no block sampling, so the sample is a seeded set of
+# contiguous blocks that are read on their own, like DuckDB's system sampling:
+# SQLite seeks rowid ranges of one DuckDB vector, Polars slices parts at DuckDB's
+# default Parquet row group size (the one 01_generate_data.py writes with)
+SQLITE_BLOCK_ROWS = 2048
+POLARS_BLOCK_ROWS = 122_880
+
+# queries answered from a row sample, and the result columns that are counts or
+# sums and therefore scaled by 1/rate; averages and rates are left as they are.
+# Q2 is approximated with distinct-count sketches instead, Q3 (exact top-N) has
+# no sampled equivalent.
+SAMPLED: dict[str, list[str]] = {
+    "Q1_conditional_agg_rates": ["n"],
+    "Q4_running_total": ["monthly_salary", "cumulative_salary"],
+    "Q5_join_vs_avg": ["above_avg_count"],
+    "Q6_selective_like_filter": ["n"],
+}
+
+SKETCH_QUERY = "Q2_distinct_counts"
+SKETCH_SQL = """
+    SELECT
+      "year-month" AS ym,
+      company_name,
+      COUNT(*) AS rows,
+      approx_count_distinct(employee_id) AS distinct_employees,
+      approx_count_distinct(fullname) AS distinct_names
+    FROM data
+    WHERE state_of_residence IN ('California','New York','Florida')
+    GROUP BY ym, company_name
+"""
+
+def log(line: str) -> None:
+    print(line)
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def now_s() -> float:
+    return time.perf_counter()
+
+
+class HyperLogLog:
+    """SQLite aggregate: HyperLogLog distinct count with 2**P registers (~0.8% error at P=14)."""
+
+    P = 14
+    M = 1 << P
+    ALPHA = 0.7213 / (1 + 1.079 / M)
+    REST_BITS = 64 - P
+    REST_MASK = (1 << REST_BITS) - 1
+
+    def __init__(self):
+        self.registers = bytearray(self.M)
+
+    def step(self, value) -> None:
+        if value is None:
+            return
+        # str hashing is randomised per process but stable within one query
+        h = hash(value) & 0xFFFF_FFFF_FFFF_FFFF
+        idx = h >> self.REST_BITS
+        rank = self.REST_BITS - (h & self.REST_MASK).bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def finalize(self) -> int:
+        est = self.ALPHA * self.M * self.M / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if est <= 2.5 * self.M and zeros:
+            # small-range correction (linear counting)
+            est = self.M * math.log(self.M / zeros)
+        return int(round(est))
+
+
+def pick_blocks(n_blocks: int, rate: float) -> list[int]:
+    k = min(n_blocks, max(1, round(n_blocks * rate)))
+    return sorted(random.Random(SAMPLE_SEED).sample(range(n_blocks), k))
+
+def sql_sample(engine: str, conn, rate: float) -> tuple[str, float]:
+    """(subquery that replaces `data`, fraction of rows it reads)."""
+    if engine == "duckdb":
+        return f"(SELECT * FROM data USING SAMPLE {rate * 100:g}% (system, {SAMPLE_SEED}))", rate
+
+    max_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM data").fetchone()[0]
+    starts = [1 + b * SQLITE_BLOCK_ROWS for b in pick_blocks(math.ceil(max_rowid / SQLITE_BLOCK_ROWS), rate)]
+    values = ",".join(f"({a})" for a in starts)
+    # CROSS JOIN keeps the block list as the outer loop, so each block is a rowid range seek
+    sample = (
+        f"(SELECT data.* FROM (VALUES {values}) AS blocks CROSS JOIN data "
+        f"ON data.rowid BETWEEN blocks.column1 AND blocks.column1 + {SQLITE_BLOCK_ROWS - 1})"
+    )
+    return sample, len(starts) * SQLITE_BLOCK_ROWS / max_rowid
+
+def sampled_sql(sql: str, sample: str) -> str:
+    return re.sub(r"\bFROM data\b", lambda _: f"FROM {sample}", sql)
+
+def fetch_sql(conn, sql: str) -> tuple[list[str], list[tuple]]:
+    cur = conn.execute(sql)
+    names = [d[0] for d in cur.description]
+    return names, cur.fetchall()
+
+def fetch_polars(lf: pl.LazyFrame) -> tuple[list[str], list[tuple]]:
+    df = lf.collect()
+    return df.columns, df.rows()
+
+def scale(result: tuple[list[str], list[tuple]], cols: list[str], factor: float) -> tuple[list[str], list[tuple]]:
+    names, rows = result
+    pos = {names.index(c) for c in cols}
+    return names, [tuple(v * factor if i in pos else v for i, v in enumerate(r)) for r in rows]
+
+def time_runner(runner) -> tuple[float, object]:
+    for _ in range(WARMUP):
+        _ = runner()
+
+    times: list[float] = []
+    last = None
+
+    for _ in range(REPEATS):
+        t0 = now_s()
+        last = runner()
+        t1 = now_s()
+        times.append(t1 - t0)
+
+    return median(times), last
+
+
+def compare(exact: tuple[list[str], list[tuple]], approx: tuple[list[str], list[tuple]]) -> tuple[float, float, int]:
+    """(mean relative error, max relative error, groups missing from the approximation)."""
+    def split(rows):
+        out = {}
+        for r in rows:
+            key = tuple(v for v in r if isinstance(v, str))
+            out[key] = [float(v) for v in r if not isinstance(v, str) and v is not None]
+        return out
+
+    exp = split(exact[1])
+    got = split(approx[1])
+
+    errors: list[float] = []
+    for key, values in exp.items():
+        if key not in got:
+            continue
+        for e, a in zip(values, got[key]):
+            if e != 0:
+                errors.append(abs(a - e) / abs(e))
+
+    missing = sum(1 for k in exp if k not in got)
+    if not errors:
+        return 0.0, 0.0, missing
+    return sum(errors) / len(errors), max(errors), missing
+
+def report(engine: str, qname: str, mode: str, exact_s: float, approx_s: float, exact, approx) -> None:
+    mean_err, max_err, missing = compare(exact, approx)
+    speedup = exact_s / approx_s if approx_s > 0 else float("inf")
+    log(
+        f"{engine} | {qname} | {mode} | exact={exact_s:.4f}s | approx={approx_s:.4f}s | speedup={speedup:.1f}x "
+        f"| mean_rel_err={mean_err:.4%} | max_rel_err={max_err:.4%} | missing_groups={missing}/{len(exact[1])}"
+    )
+
+
+def benchmark_sql_engine(name: str, conn) -> None:
+    for qname, sql in QUERIES:
+        if qname == SKETCH_QUERY:
+            exact_s, exact = time_runner(lambda: fetch_sql(conn, sql))
+            approx_s, approx = time_runner(lambda: fetch_sql(conn, SKETCH_SQL))
+            report(name, qname, "hll", exact_s, approx_s, exact, approx)
+            continue
+
+        if qname not in SAMPLED:
+            continue
+
+        exact_s, exact = time_runner(lambda: fetch_sql(conn, sql))
+        for rate in SAMPLE_RATES:
+            sample, fraction = sql_sample(name, conn, rate)
+            q = sampled_sql(sql, sample)
+            approx_s, approx = time_runner(lambda: scale(fetch_sql(conn, q), SAMPLED[qname], 1 / fraction))
+            report(name, qname, f"sample={rate:g}", exact_s, approx_s, exact, approx)
+
+
+def polars_q2_approx(lf: pl.LazyFrame) -> pl.LazyFrame:
+    return (
+        lf.filter(pl.col("state_of_residence").is_in(["California", "New York", "Florida"]))
+        .group_by([pl.col("year-month").alias("ym"), pl.col("company_name")])
+        .agg([
+            pl.len().alias("rows"),
+            pl.col("employee_id").approx_n_unique().alias("distinct_employees"),
+            pl.col("fullname").approx_n_unique().alias("distinct_names"),
+        ])
+    )
+
+def polars_sample(rate: float) -> tuple[pl.LazyFrame, float]:
+    """(scan over a seeded set of row-group-sized slices, fraction of rows it reads)."""
+    blocks: list[tuple[Path, int, int]] = []
+    for part in sorted(PARQUET_DIR.glob("part_*.parquet")):
+        rows = pl.scan_parquet(part).select(pl.len()).collect().item()
+        for offset in range(0, rows, POLARS_BLOCK_ROWS):
+            blocks.append((part, offset, min(POLARS_BLOCK_ROWS, rows - offset)))
+
+    picked = [blocks[b] for b in pick_blocks(len(blocks), rate)]
+    lf = pl.concat([pl.scan_parquet(part).slice(offset, n) for part, offset, n in picked])
+    return lf, sum(n for _, _, n in picked) / sum(n for _, _, n in blocks)
+
+def benchmark_polars() -> None:
+    queries = dict(polars_bench.QUERIES)
+    lf = pl.scan_parquet(PARQUET_GLOB)
+    samples = {rate: polars_sample(rate) for rate in SAMPLE_RATES}
+
+    exact_s, exact = time_runner(lambda: fetch_polars(queries[SKETCH_QUERY](lf)))
+    approx_s, approx = time_runner(lambda: fetch_polars(polars_q2_approx(lf)))
+    report("polars", SKETCH_QUERY, "hll", exact_s, approx_s, exact, approx)
+
+    for qname, cols in SAMPLED.items():
+        qfn = queries[qname]
+        exact_s, exact = time_runner(lambda: fetch_polars(qfn(lf)))
+        for rate in SAMPLE_RATES:
+            sampled, fraction = samples[rate]
+            approx_s, approx = time_runner(lambda: scale(fetch_polars(qfn(sampled)), cols, 1 / fraction))
+            report("polars", qname, f"sample={rate:g}", exact_s, approx_s, exact, approx)
+
+
+def ensure_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute("PRAGMA synchronous=NORMAL;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA cache_size=-200000;")
+    conn.commit()
+
+
+def main() -> None:
+    if not SQLITE_PATH.exists():
+        raise FileNotFoundError(f"SQLite db not found: {SQLITE_PATH}")
+    if not DUCKDB_PATH.exists():
+        raise FileNotFoundError(f"DuckDB db not found: {DUCKDB_PATH}")
+
+    if LOG_PATH.exists():
+        LOG_PATH.unlink()
+
+    log("meta | approx_benchmark_start")
+    log(f"meta | warmup={WARMUP} repeats={REPEATS}")
+    log(f"meta | sample_rates={','.join(f'{r:g}' for r in SAMPLE_RATES)} hll_precision={HyperLogLog.P}")
+    log(
+        f"meta | sampling duckdb=system sqlite=rowid_blocks({SQLITE_BLOCK_ROWS}) "
+        f"polars=parquet_slices({POLARS_BLOCK_ROWS}) seed={SAMPLE_SEED}"
+    )
+
+    sqlite_conn = sqlite3.connect(SQLITE_PATH.as_posix())
+    ensure_sqlite_pragmas(sqlite_conn)
+    sqlite_conn.create_aggregate("approx_count_distinct", 1, HyperLogLog)
+
+    log("bench | start | engine=sqlite")
+    benchmark_sql_engine("sqlite", sqlite_conn)
+    sqlite_conn.close()
+
+    duck_conn = duckdb.connect(DUCKDB_PATH.as_posix())
+    duck_conn.execute(f"PRAGMA threads={DUCKDB_THREADS};")
+
+    log("bench | start | engine=duckdb")
+    benchmark_sql_engine("duckdb", duck_conn)
+    duck_conn.close()
+
+    log("bench | start | engine=polars")
+    benchmark_polars()
+
+    log("meta | approx_benchmark_done")
+    log(f"meta | log_file={LOG_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+QUERIES: list[tuple[str, str]] = [
+    ("Q1_conditional_agg_rates", """
+        WITH base AS (
+          SELECT
+            company_name,
+            function,
+            "year-month" AS ym,
+            state_of_residence AS state,
+            gender,
+            segmentation,
+            salary_usd,
+            performance_score,
+            flag_leave,
+            flag_turnover,
+            is_promoted
+          FROM data
+          WHERE year IN ('2022Y','2023Y','2024Y')
+        )
+        SELECT
+          company_name,
+          function,
+          ym,
+          state,
+          gender,
+          segmentation,
+          COUNT(*) AS n,
+          AVG(salary_usd) AS avg_salary,
+          AVG(performance_score) AS avg_perf,
+          SUM(CASE WHEN performance_score >= 4 THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS pct_perf4,
+          SUM(CASE WHEN is_promoted = 1 THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS promo_rate,
+          SUM(flag_leave) * 1.0 / COUNT(*) AS leave_rate,
+          SUM(flag_turnover) * 1.0 / COUNT(*) AS turnover_rate
+        FROM base
+        GROUP BY company_name, function, ym, state, gender, segmentation
+    """),
+
+    ("Q2_distinct_counts", """
+        SELECT
+          "year-month" AS ym,
+          company_name,
+          COUNT(*) AS rows,
+          COUNT(DISTINCT employee_id) AS distinct_employees,
+          COUNT(DISTINCT fullname) AS distinct_names
+        FROM data
+        WHERE state_of_residence IN ('California','New York','Florida')
+        GROUP BY ym, company_name
+    """),
+
+    ("Q3_topN_per_group", """
+        SELECT *
+        FROM (
+          SELECT
+            company_name,
+            "year-month" AS ym,
+            employee_id,
+            salary_usd,
+            performance_score,
+            ROW_NUMBER() OVER (
+              PARTITION BY company_name, "year-month"
+              ORDER BY salary_usd DESC
+            ) AS rn
+          FROM data
+          WHERE year='2024Y'
+        )
+        WHERE rn <= 10
+    """),
+
+    ("Q4_running_total", """
+        WITH m AS (
+          SELECT
+            company_name,
+            "year-month" AS ym,
+            SUM(salary_usd) AS monthly_salary
+          FROM data
+          GROUP BY company_name, "year-month"
+        )
+        SELECT
+          company_name,
+          ym,
+          monthly_salary,
+          SUM(monthly_salary) OVER (
+            PARTITION BY company_name
+            ORDER BY ym
+            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+          ) AS cumulative_salary
+        FROM m
+    """),
+
+    ("Q5_join_vs_avg", """
+        WITH avg_by_grp AS (
+          SELECT
+            company_name,
+            "year-month" AS ym,
+            AVG(salary_usd) AS avg_salary
+          FROM data
+          GROUP BY company_name, "year-month"
+        )
+        SELECT
+          d.company_name,
+          d."year-month" AS ym,
+          COUNT(*) AS above_avg_count
+        FROM data d
+        JOIN avg_by_grp a
+          ON d.company_name = a.company_name
+         AND d."year-month" = a.ym
+        WHERE d.salary_usd > a.avg_salary
+        GROUP BY d.company_name, d."year-month"
+    """),
+
+    ("Q6_selective_like_filter", """
+        SELECT
+          company_name,
+          function,
+          "year-month" AS ym,
+          COUNT(*) AS n,
+          AVG(salary_usd) AS avg_salary
+        FROM data
+        WHERE year='2023Y'
+          AND state_of_residence='California'
+          AND function LIKE '%Sales%'
+          AND employee_type='White-Collar'
+        GROUP BY company_name, function, ym
+    """),
+]
+
+# Parameterized versions of the catalog. Placeholders are filled by render();
+# each parameter is (type, domain) where domain names a value array in
+# 01_generate_data.py or gives an inclusive (low, high) range.
+PARAM_TYPES = ("text", "text_list", "int", "real")
+
+Q6_PREDICATE = """
+          year IN {years}
+          AND state_of_residence IN {states}
+          AND function IN {functions}
+          AND employee_type IN {employee_types}
+          AND salary_usd >= {salary_min}
+"""
+
+TEMPLATES: list[tuple[str, str, dict[str, tuple[str, object]]]] = [
+    ("Q1_conditional_agg_rates", """
+        SELECT
+          company_name,
+          function,
+          "year-month" AS ym,
+          state_of_residence AS state,
+          gender,
+          segmentation,
+          COUNT(*) AS n,
+          AVG(salary_usd) AS avg_salary,
+          AVG(performance_score) AS avg_perf,
+          SUM(CASE WHEN performance_score >= 4 THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS pct_perf4,
+          SUM(CASE WHEN is_promoted = 1 THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS promo_rate,
+          SUM(flag_leave) * 1.0 / COUNT(*) AS leave_rate,
+          SUM(flag_turnover) * 1.0 / COUNT(*) AS turnover_rate
+        FROM data
+        WHERE year IN {years}
+        GROUP BY company_name, function, ym, state, gender, segmentation
+    """, {"years": ("text_list", "YEAR")}),
+
+    ("Q2_distinct_counts", """
+        SELECT
+          "year-month" AS ym,
+          company_name,
+          COUNT(*) AS rows,
+          COUNT(DISTINCT employee_id) AS distinct_employees,
+          COUNT(DISTINCT fullname) AS distinct_names
+        FROM data
+        WHERE state_of_residence IN {states}
+        GROUP BY ym, company_name
+    """, {"states": ("text_list", "STATES")}),
+
+    ("Q3_topN_per_group", """
+        SELECT *
+        FROM (
+          SELECT
+            company_name,
+            "year-month" AS ym,
+            employee_id,
+            salary_usd,
+            performance_score,
+            ROW_NUMBER() OVER (
+              PARTITION BY company_name, "year-month"
+              ORDER BY salary_usd DESC
+            ) AS rn
+          FROM data
+          WHERE year={year}
+        )
+        WHERE rn <= {top_n}
+    """, {"year": ("text", "YEAR"), "top_n": ("int", (1, 100))}),
+
+    ("Q6_selective_filter", """
+        SELECT
+          company_name,
+          function,
+          "year-month" AS ym,
+          COUNT(*) AS n,
+          AVG(salary_usd) AS avg_salary
+        FROM data
+        WHERE""" + Q6_PREDICATE + """
+        GROUP BY company_name, function, ym
+    """, {
+        "years": ("text_list", "YEAR"),
+        "states": ("text_list", "STATES"),
+        "functions": ("text_list", "FUNCTION"),
+        "employee_types": ("text_list", "EMPLOYEE_TYPE"),
+        "salary_min": ("real", (0.0, 100_000.0)),
+    }),
+]
+
+
+def sql_literal(kind: str, value) -> str:
+    if kind == "text":
+        return "'" + str(value).replace("'", "''") + "'"
+    if kind == "text_list":
+        if not value:
+            raise ValueError("text_list parameter needs at least one value")
+        return "(" + ",".join(sql_literal("text", v) for v in value) + ")"
+    if kind == "int":
+        return str(int(value))
+    if kind == "real":
+        return repr(float(value))
+    raise ValueError(f"unknown parameter type: {kind}")
+
+
+def render(sql: str, spec: dict[str, tuple[str, object]], params: dict[str, object]) -> str:
+    missing = set(spec) - set(params)
+    if missing:
+        raise KeyError(f"missing parameters: {sorted(missing)}")
+    return sql.format(**{name: sql_literal(kind, params[name]) for name, (kind, _) in spec.items()})
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+PARTS_TABLE = "loaded_parts"
+
+# (table, [(dimension expr, alias)], [(measure expr, alias)])
+# Every measure is additive, so a rollup can be merged with the rollup of
+# newly appended rows by summing instead of re-scanning the base table.
+ROLLUPS: list[tuple[str, list[tuple[str, str]], list[tuple[str, str]]]] = [
+    ("rollup_detail",
+     [
+         ("company_name", "company_name"),
+         ("function", "function"),
+         ('"year-month"', "ym"),
+         ("state_of_residence", "state"),
+         ("gender", "gender"),
+         ("segmentation", "segmentation"),
+         ("year", "year"),
+     ],
+     [
+         ("COUNT(*)", "n"),
+         ("SUM(salary_usd)", "sum_salary"),
+         ("SUM(performance_score)", "sum_perf"),
+         ("SUM(CASE WHEN performance_score >= 4 THEN 1 ELSE 0 END)", "cnt_perf4"),
+         ("SUM(CASE WHEN is_promoted = 1 THEN 1 ELSE 0 END)", "cnt_promoted"),
+         ("SUM(flag_leave)", "sum_leave"),
+         ("SUM(flag_turnover)", "sum_turnover"),
+         ("SUM(flag_hire)", "sum_hire"),
+     ]),
+
+    ("rollup_company_month",
+     [
+         ("company_name", "company_name"),
+         ('"year-month"', "ym"),
+     ],
+     [
+         ("COUNT(*)", "n"),
+         ("SUM(salary_usd)", "sum_salary"),
+         ("SUM(flag_leave)", "sum_leave"),
+         ("SUM(flag_turnover)", "sum_turnover"),
+         ("SUM(flag_hire)", "sum_hire"),
+     ]),
+]
+
+# query name -> (rollup it needs, equivalent SQL answered from that rollup)
+ROUTES: dict[str, tuple[str, str]] = {
+    "Q1_conditional_agg_rates": ("rollup_detail", """
+        SELECT
+          company_name,
+          function,
+          ym,
+          state,
+          gender,
+          segmentation,
+          SUM(n) AS n,
+          SUM(sum_salary) * 1.0 / SUM(n) AS avg_salary,
+          SUM(sum_perf) * 1.0 / SUM(n) AS avg_perf,
+          SUM(cnt_perf4) * 1.0 / SUM(n) AS pct_perf4,
+          SUM(cnt_promoted) * 1.0 / SUM(n) AS promo_rate,
+          SUM(sum_leave) * 1.0 / SUM(n) AS leave_rate,
+          SUM(sum_turnover) * 1.0 / SUM(n) AS turnover_rate
+        FROM rollup_detail
+        WHERE year IN ('2022Y','2023Y','2024Y')
+        GROUP BY company_name, function, ym, state, gender, segmentation
+    """),
+
+    "Q4_running_total": ("rollup_company_month", """
+        WITH m AS (
+          SELECT
+            company_name,
+            ym,
+            sum_salary AS monthly_salary
+          FROM rollup_company_month
+        )
+        SELECT
+          company_name,
+          ym,
+          monthly_salary,
+          SUM(monthly_salary) OVER (
+            PARTITION BY company_name
+            ORDER BY ym
+            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+          ) AS cumulative_salary
+        FROM m
+    """),
+
+    # only the per-group average comes from the rollup; the comparison
+    # against individual salaries still has to scan the base table
+    "Q5_join_vs_avg": ("rollup_company_month", """
+        WITH avg_by_grp AS (
+          SELECT
+            company_name,
+            ym,
+            sum_salary * 1.0 / n AS avg_salary
+          FROM rollup_company_month
+        )
+        SELECT
+          d.company_name,
+          d."year-month" AS ym,
+          COUNT(*) AS above_avg_count
+        FROM data d
+        JOIN avg_by_grp a
+          ON d.company_name = a.company_name
+         AND d."year-month" = a.ym
+        WHERE d.salary_usd > a.avg_salary
+        GROUP BY d.company_name, d."year-month"
+    """),
+}
+
+
+def rollup_select(dims: list[tuple[str, str]], measures: list[tuple[str, str]], source: str) -> str:
+    select_list = ", ".join(f"{expr} AS {alias}" for expr, alias in dims + measures)
+    group_list = ", ".join(expr for expr, _ in dims)
+    return f"SELECT {select_list} FROM {source} GROUP BY {group_list}"
+
+
+def build_rollups(con, source: str = "data") -> None:
+    for name, dims, measures in ROLLUPS:
+        con.execute(f"DROP TABLE IF EXISTS {name};")
+        con.execute(f"CREATE TABLE {name} AS {rollup_select(dims, measures, source)};")
+
+
+def refresh_rollups(con, delta_source: str) -> None:
+    """Fold the aggregates of `delta_source` (the newly appended rows) into every rollup."""
+    for name, dims, measures in ROLLUPS:
+        dim_cols = [alias for _, alias in dims]
+        measure_cols = [alias for _, alias in measures]
+        col_list = ", ".join(dim_cols + measure_cols)
+        merged_list = ", ".join(dim_cols + [f"SUM({c}) AS {c}" for c in measure_cols])
+
+        con.execute(f"""
+            CREATE TEMP TABLE rollup_merged AS
+            SELECT {merged_list}
+            FROM (
+              SELECT {col_list} FROM {name}
+              UNION ALL
+              {rollup_select(dims, measures, delta_source)}
+            ) u
+            GROUP BY {", ".join(dim_cols)};
+        """)
+        con.execute(f"DELETE FROM {name};")
+        con.execute(f"INSERT INTO {name} ({col_list}) SELECT {col_list} FROM rollup_merged;")
+        con.execute("DROP TABLE rollup_merged;")
+
+
+def existing_tables(con, engine: str) -> set[str]:
+    if engine == "sqlite":
+        rows = con.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    else:
+        rows = con.execute("SELECT table_name FROM information_schema.tables").fetchall()
+    return {r[0] for r in rows}
+
+
+def record_parts(con, parts: list[str]) -> None:
+    con.execute(f"CREATE TABLE IF NOT EXISTS {PARTS_TABLE} (part TEXT PRIMARY KEY);")
+    con.executemany(f"INSERT INTO {PARTS_TABLE} (part) VALUES (?)", [(p,) for p in parts])
+
+
+def loaded_parts(con) -> set[str]:
+    return {r[0] for r in con.execute(f"SELECT part FROM {PARTS_TABLE}").fetchall()}
+
+
+def route(qname: str, sql: str, available: set[str]) -> tuple[str, str]:
+    """Return (sql, source): the rollup rewrite if its table exists, else the base query."""
+    target = ROUTES.get(qname)
+    if target is None or target[0] not in available:
+        return sql, "data"
+    return target[1], target[0]
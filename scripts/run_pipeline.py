@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "scripts"
+PARQUET_DIR = ROOT / "data" / "data_10m"
+DB_DIR = ROOT / "db"
+LOG_DIR = ROOT / "logs"
+
+PIPELINE_LOG_DIR = LOG_DIR / "pipeline"
+STATE_PATH = ROOT / ".pipeline_state.json"
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    script: str
+    deps: tuple[str, ...] = ()
+    # other files whose contents change the step's result (shared modules, ...)
+    sources: tuple[str, ...] = ()
+    outputs: tuple[Path, ...] = ()
+    # whether the Parquet dataset itself is an input
+    reads_dataset: bool = False
+    # requested CPUs; capped at an even share of the budget while steps overlap
+    cpus: int = 1
+    # exclusive resources: DuckDB allows one process per database file, and the
+    # SQLite benchmarks must not overlap with steps that write to sqlite.db
+    locks: tuple[str, ...] = ()
+    # timing steps run alone so that concurrent steps neither skew their numbers
+    # nor compete with them for memory
+    measures: bool = False
+    # script and arguments that bring the outputs up to date when parts were only
+    # appended to the dataset since the last run
+    refresh: tuple[str, ...] = ()
+    # delete the outputs before running (the generator skips an existing dataset)
+    clean_outputs: bool = False
+
+
+LOADS = ("load_sqlite", "load_duckdb")
+BOTH_DBS = ("sqlite_db", "duckdb_db")
+
+# new parts appended to the dataset are loaded with 07_refresh_rollups.py; any
+# other dataset change reruns the loaders from scratch
+STEPS: list[Step] = [
+    Step("generate", "01_generate_data.py", outputs=(PARQUET_DIR,), cpus=1, clean_outputs=True),
+    Step("load_sqlite", "02_load_sqlite.py", ("generate",), ("rollups.py",),
+         (DB_DIR / "sqlite.db",), reads_dataset=True, cpus=2, locks=("sqlite_db",),
+         refresh=("07_refresh_rollups.py", "sqlite")),
+    Step("load_duckdb", "03_load_duckdb.py", ("generate",), ("rollups.py",),
+         (DB_DIR / "duckdb.db",), reads_dataset=True, cpus=4, locks=("duckdb_db",),
+         refresh=("07_refresh_rollups.py", "duckdb")),
+    Step("bench_sql", "04_benchmark.py", LOADS, ("queries.py",),
+         (LOG_DIR / "benchmark.log",), cpus=4, locks=BOTH_DBS, measures=True),
+    Step("bench_polars", "05_benchmark_polars.py", ("generate",), (),
+         (LOG_DIR / "benchmark_polars.log",), reads_dataset=True, cpus=4, measures=True),
+    Step("bench_read", "06_read_benchmark_db.py", LOADS, (),
+         (LOG_DIR / "read_benchmark.log",), cpus=4, locks=BOTH_DBS, measures=True),
+    Step("bench_rollups", "08_benchmark_rollups.py", LOADS, ("queries.py", "rollups.py"),
+         (LOG_DIR / "benchmark_rollups.log",), cpus=4, locks=BOTH_DBS, measures=True),
+    Step("bench_workload", "09_workload_sweep.py", LOADS, ("queries.py", "01_generate_data.py"),
+         (LOG_DIR / "workload_sweep.log",), reads_dataset=True, cpus=4, locks=BOTH_DBS, measures=True),
+    Step("bench_export", "10_benchmark_export.py", LOADS, (),
+         (LOG_DIR / "benchmark_export.log",), reads_dataset=True, cpus=4, locks=BOTH_DBS, measures=True),
+    Step("bench_oltp", "11_benchmark_oltp.py", LOADS, (),
+         (LOG_DIR / "benchmark_oltp.log",), cpus=2, locks=BOTH_DBS, measures=True),
+    Step("bench_pandas_arrow", "12_benchmark_pandas_arrow.py", ("generate",), (),
+         (LOG_DIR / "benchmark_pandas_arrow.log",), reads_dataset=True, cpus=4, measures=True),
+    Step("bench_numpy", "13_benchmark_numpy.py", ("generate", "load_duckdb"), ("queries.py", "01_generate_data.py"),
+         (LOG_DIR / "benchmark_numpy.log",), reads_dataset=True, cpus=1, locks=("duckdb_db",), measures=True),
+    Step("sqlite_matrix", "14_sqlite_matrix.py", ("load_sqlite",), ("queries.py",),
+         (LOG_DIR / "sqlite_matrix.log",), cpus=1, locks=("sqlite_db",), measures=True),
+    Step("bench_memory", "15_benchmark_memory.py", ("generate", "load_duckdb"), ("queries.py", "05_benchmark_polars.py"),
+         (LOG_DIR / "benchmark_memory.log",), reads_dataset=True, cpus=4, locks=("duckdb_db",), measures=True),
+    Step("bench_approx", "16_benchmark_approx.py", LOADS, ("queries.py", "05_benchmark_polars.py"),
+         (LOG_DIR / "benchmark_approx.log",), reads_dataset=True, cpus=4, locks=BOTH_DBS, measures=True),
+]
+
+
+def log(line: str) -> None:
+    print(f"[pipeline] {line}", flush=True)
+
+def now_s() -> float:
+    return time.perf_counter()
+
+
+def dataset_manifest() -> list[str]:
+    parts = sorted(PARQUET_DIR.glob("part_*.parquet"))
+    return [f"{p.name}:{p.stat().st_size}:{p.stat().st_mtime_ns}" for p in parts]
+
+def code_fingerprint(step: Step, fps: dict[str, str]) -> str:
+    h = hashlib.sha256()
+    for name in (step.script,) + step.sources + step.refresh[:1]:
+        h.update(name.encode())
+        h.update((SCRIPTS_DIR / name).read_bytes())
+    for dep in step.deps:
+        h.update(f"{dep}={fps[dep]}".encode())
+    return h.hexdigest()
+
+def fingerprint(code: str, manifest: list[str] | None) -> str:
+    h = hashlib.sha256(code.encode())
+    if manifest is not None:
+        h.update("\n".join(manifest).encode())
+    return h.hexdigest()
+
+def only_appended(old: list[str] | None, new: list[str] | None) -> bool:
+    """Whether `new` keeps every part of `old` unchanged and adds at least one."""
+    if not old or not new:
+        return False
+    return set(old) < set(new)
+
+def load_state() -> dict[str, dict]:
+    if not STATE_PATH.exists():
+        return {}
+    state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    # entries from older state files have no manifest; treat them as stale
+    return {k: v for k, v in state.items() if isinstance(v, dict)}
+
+def save_state(state: dict[str, dict]) -> None:
+    tmp = STATE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(STATE_PATH)
+
+
+def with_deps(targets: list[str], by_name: dict[str, Step]) -> list[Step]:
+    wanted: set[str] = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in by_name:
+            raise KeyError(f"unknown step: {name}")
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(by_name[name].deps)
+    # STEPS is already in dependency order
+    return [s for s in STEPS if s.name in wanted]
+
+def clean(paths: tuple[Path, ...]) -> None:
+    for p in paths:
+        if p.is_dir():
+            shutil.rmtree(p)
+        elif p.exists():
+            p.unlink()
+
+def run_step(step: Step, command: tuple[str, ...], done: queue.Queue) -> None:
+    PIPELINE_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    out_path = PIPELINE_LOG_DIR / f"{step.name}.out"
+
+    t0 = now_s()
+    with open(out_path, "w", encoding="utf-8") as out:
+        rc = subprocess.run(
+            [sys.executable, (SCRIPTS_DIR / command[0]).as_posix(), *command[1:]],
+            cwd=ROOT, stdout=out, stderr=subprocess.STDOUT,
+        ).returncode
+    done.put((step.name, rc, now_s() - t0))
+
+
+def run(steps: list[Step], cpu_budget: int, forced: set[str]) -> bool:
+    state = load_state()
+    fps: dict[str, str] = {}
+    codes: dict[str, str] = {}
+    manifests: dict[str, list[str] | None] = {}
+    pending = list(steps)
+    running: dict[str, Step] = {}
+    allotted: dict[str, int] = {}
+    finished: set[str] = set()
+    failed: set[str] = set()
+    held: set[str] = set()
+    free = cpu_budget
+    done: queue.Queue = queue.Queue()
+
+    while pending or running:
+        progressed = True
+        while progressed:
+            progressed = False
+            ready: list[Step] = []
+            for step in list(pending):
+                if any(d in failed for d in step.deps):
+                    pending.remove(step)
+                    failed.add(step.name)
+                    log(f"{step.name} | skipped: upstream failed")
+                    progressed = True
+                    continue
+                if not all(d in finished for d in step.deps):
+                    continue
+
+                # fingerprint only once upstream outputs are final
+                if step.name not in fps:
+                    codes[step.name] = code_fingerprint(step, fps)
+                    manifests[step.name] = dataset_manifest() if step.reads_dataset else None
+                    fps[step.name] = fingerprint(codes[step.name], manifests[step.name])
+                prev = state.get(step.name, {})
+                outputs_exist = all(p.exists() for p in step.outputs)
+                fresh = prev.get("fp") == fps[step.name] and outputs_exist
+                if fresh and step.name not in forced:
+                    pending.remove(step)
+                    finished.add(step.name)
+                    log(f"{step.name} | up to date")
+                    progressed = True
+                    continue
+                ready.append(step)
+
+            # steps that may run side by side split the budget, so one large request
+            # cannot hold back an independent step; a measuring step runs alone
+            sharing = [s for s in ready + list(running.values()) if not s.measures]
+            share = max(1, cpu_budget // max(1, len(sharing)))
+            for step in ready:
+                cpus = min(step.cpus, cpu_budget if step.measures else share)
+                if cpus > free or held & set(step.locks):
+                    continue
+                if running and (step.measures or any(s.measures for s in running.values())):
+                    continue
+
+                prev = state.get(step.name, {})
+                outputs_exist = all(p.exists() for p in step.outputs)
+                incremental = (
+                    bool(step.refresh) and step.name not in forced and outputs_exist
+                    and prev.get("code") == codes[step.name]
+                    and only_appended(prev.get("manifest"), manifests[step.name])
+                )
+                command = step.refresh if incremental else (step.script,)
+                if step.clean_outputs:
+                    clean(step.outputs)
+
+                pending.remove(step)
+                running[step.name] = step
+                allotted[step.name] = cpus
+                free -= cpus
+                held |= set(step.locks)
+                mode = "refresh" if incremental else "full"
+                log(f"{step.name} | start | mode={mode} cpus={cpus} free={free}")
+                threading.Thread(target=run_step, args=(step, command, done), daemon=True).start()
+                progressed = True
+
+        if not running:
+            break
+
+        name, rc, seconds = done.get()
+        step = running.pop(name)
+        free += allotted.pop(name)
+        held -= set(step.locks)
+
+        if rc == 0:
+            finished.add(name)
+            state[name] = {"fp": fps[name], "code": codes[name], "manifest": manifests[name]}
+            save_state(state)
+            log(f"{name} | done | seconds={seconds:.1f}")
+        else:
+            failed.add(name)
+            state.pop(name, None)
+            save_state(state)
+            log(f"{name} | FAILED rc={rc} | see {PIPELINE_LOG_DIR / (name + '.out')}")
+
+    return not failed
+
+
+def main() -> None:
+    by_name = {s.name: s for s in STEPS}
+
+    parser = argparse.ArgumentParser(description="Run the generate -> load -> benchmark pipeline, skipping up-to-date steps.")
+    parser.add_argument("steps", nargs="*", help=f"steps to run with their dependencies (default: all): {', '.join(by_name)}")
+    parser.add_argument("--cpus", type=int, default=os.cpu_count() or 1, help="CPU budget shared by concurrent steps")
+    parser.add_argument("--force", action="store_true", help="rerun the named steps (all if none named) even if up to date")
+    args = parser.parse_args()
+
+    steps = with_deps(args.steps or list(by_name), by_name)
+    log(f"steps={','.join(s.name for s in steps)} cpus={args.cpus}")
+
+    t0 = now_s()
+    forced = set(args.steps or by_name) if args.force else set()
+    ok = run(steps, max(args.cpus, 1), forced)
+    t1 = now_s()
+    log(f"{'done' if ok else 'failed'} | seconds={(t1 - t0):.1f}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()